@@ -7,11 +7,21 @@
 # ============================================================================
 
 # Import required libraries
-from difflib import SequenceMatcher  # For string similarity comparison
-from datetime import datetime  # For handling time queries
-from typing import Dict, Tuple  # For type annotations
+from typing import Dict, List, Tuple  # For type annotations
 import json  # For loading responses from JSON file
 import os  # For checking file existence
+import sys  # For buffered console output and string interning
+
+# Optional C++ fuzzy matching, imported on first use by load_fuzzy_backend();
+# falls back to the pure Python matcher below
+fuzz = process = None
+_fuzzy_backend_checked: bool = False
+
+# Optional Rust JSON parser; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # ============================================================================
 # CONFIGURATION CONSTANTS
@@ -25,9 +35,77 @@ ERROR_INDICATOR: str = "✗"
 # Similarity threshold for response matching
 SIMILARITY_THRESHOLD: float = 0.6  # Minimum similarity for valid response
 
+# Maximum number of cached input -> response lookups
+RESPONSE_CACHE_SIZE: int = 512
+
 # JSON file for responses
 RESPONSES_FILE: str = "responses.json"
 
+# ============================================================================
+# BIT-PARALLEL SIMILARITY
+# ============================================================================
+def load_fuzzy_backend() -> bool:
+    """
+    Imports rapidfuzz the first time matching is needed, keeping startup fast.
+
+    Returns:
+        bool: True if rapidfuzz is available, False to use the fallback matcher.
+    """
+    global fuzz, process, _fuzzy_backend_checked
+    if not _fuzzy_backend_checked:
+        _fuzzy_backend_checked = True
+        try:
+            from rapidfuzz import fuzz, process
+        except ImportError:
+            pass
+    return process is not None
+
+def build_character_masks(pattern: str) -> Dict[str, int]:
+    """
+    Builds a bitmask per character marking where it occurs in the pattern.
+
+    Args:
+        pattern (str): The string to index.
+
+    Returns:
+        Dict[str, int]: Character -> bitmask with bit i set if pattern[i] is that character.
+    """
+    masks: Dict[str, int] = {}
+    for position, character in enumerate(pattern):
+        masks[character] = masks.get(character, 0) | (1 << position)
+    return masks
+
+def indel_ratio(text: str, pattern_length: int, pattern_masks: Dict[str, int]) -> float:
+    """
+    Calculates the normalized indel similarity (the score rapidfuzz.fuzz.ratio uses).
+
+    The longest common subsequence is found with the bit-parallel algorithm of
+    Allison-Dix/Hyyro: one row of the LCS table is packed into an integer, so each
+    character of the text costs a handful of integer operations instead of a
+    Python loop over the pattern.
+
+    Args:
+        text (str): The string to compare.
+        pattern_length (int): Length of the pattern the masks were built from.
+        pattern_masks (Dict[str, int]): Masks from build_character_masks.
+
+    Returns:
+        float: 2 * LCS / (len(text) + pattern_length), between 0.0 and 1.0.
+    """
+    total_length: int = len(text) + pattern_length
+    if total_length == 0:
+        return 1.0
+
+    # A zero bit in row marks a position that extends the common subsequence
+    full_row: int = (1 << pattern_length) - 1
+    row: int = full_row
+    for character in text:
+        matches: int = row & pattern_masks.get(character, 0)
+        row = (row + matches) | (row - matches)
+
+    lcs_length: int = pattern_length - bin(row & full_row).count("1")
+    return 2 * lcs_length / total_length
+
 # ============================================================================
 # CHATBOT CLASS
 # ============================================================================
@@ -50,10 +128,32 @@ class ChatBot:
         self.name = name
         self.responses = responses
 
+        # Keys and values are fixed for the bot's lifetime, so flatten them once
+        # and lowercase the keys up front instead of on every comparison
+        self._keys: List[str] = [sys.intern(key.lower()) for key in responses]
+        self._values: List[str] = list(responses.values())
+        self._key_lengths: List[int] = [len(key) for key in self._keys]
+        self._key_masks: List[Dict[str, int]] = [build_character_masks(key) for key in self._keys]
+
+        # Exact-match lookup; the first key wins if two differ only by case
+        self._exact_responses: Dict[str, str] = {}
+        for key, value in zip(self._keys, self._values):
+            self._exact_responses.setdefault(key, value)
+
+        # Output fragments reused on every turn
+        self._separator: str = f"{SEPARATOR_LINE}\n"
+        self._name_prefix: str = f"{self.name}: "
+
+        # Cache of normalized input -> (response, similarity) for repeated queries
+        self._cache: Dict[str, Tuple[str, float]] = {}
+
     @staticmethod
     def calculate_similarity(input_sentence: str, response_sentence: str) -> float:
         """
-        Calculates the similarity ratio between two strings using SequenceMatcher.
+        Calculates the similarity ratio between two strings.
+
+        Uses rapidfuzz when installed and the bit-parallel indel_ratio otherwise;
+        both produce the same normalized edit-distance score.
 
         Args:
             input_sentence (str): The user's input string.
@@ -67,11 +167,26 @@ class ChatBot:
         """
         try:
             # STRING SIMILARITY CALCULATION
-            sequence: SequenceMatcher = SequenceMatcher(a=input_sentence.lower(), b=response_sentence.lower())
-            return sequence.ratio()
+            return ChatBot._normalized_similarity(input_sentence.lower(), response_sentence.lower())
         except AttributeError:
             raise AttributeError("Invalid input: Both arguments must be strings")
 
+    @staticmethod
+    def _normalized_similarity(input_lower: str, response_lower: str) -> float:
+        """
+        Calculates the similarity ratio between two already-lowercased strings.
+
+        Args:
+            input_lower (str): The lowercased user input.
+            response_lower (str): The lowercased response pattern.
+
+        Returns:
+            float: The similarity ratio between 0.0 and 1.0.
+        """
+        if load_fuzzy_backend():
+            return fuzz.ratio(input_lower, response_lower) / 100
+        return indel_ratio(input_lower, len(response_lower), build_character_masks(response_lower))
+
     def gets_best_response(self, user_input: str) -> Tuple[str, float]:
         """
         Finds the best response based on input similarity to response patterns.
@@ -90,21 +205,75 @@ class ChatBot:
             if not user_input.strip():
                 raise ValueError("Input cannot be empty")
 
+            # INPUT NORMALIZATION
+            # Interned so repeated inputs hash and compare by identity in the cache
+            cache_key: str = sys.intern(user_input.strip().lower())
+
+            # EXACT MATCH FAST PATH
+            exact_match = self._exact_responses.get(cache_key)
+            if exact_match is not None:
+                return exact_match, 1.0
+
+            # CACHE LOOKUP
+            cached = self._cache.pop(cache_key, None)
+            if cached is not None:
+                self._cache[cache_key] = cached  # Mark as most recently used
+                return cached
+
             # RESPONSE MATCHING
-            highest_similarity: float = 0.0
-            best_match: str = "Sorry, I didn't understand you."
+            best_match, highest_similarity = self._find_best_match(cache_key)
 
-            for response_key in self.responses:
-                similarity: float = ChatBot.calculate_similarity(user_input, response_key)
-                if similarity > highest_similarity and similarity >= SIMILARITY_THRESHOLD:
-                    highest_similarity = similarity
-                    best_match = self.responses[response_key]
+            # CACHE STORAGE (evict the least recently used entry once full)
+            if len(self._cache) >= RESPONSE_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[cache_key] = (best_match, highest_similarity)
 
             return best_match, highest_similarity
 
         except AttributeError:
             raise ValueError("Invalid input: Please provide a valid string")
 
+    def _find_best_match(self, input_lower: str) -> Tuple[str, float]:
+        """
+        Scores the normalized input against every response key.
+
+        With rapidfuzz installed the whole scan, threshold check and argmax run in
+        a single native extractOne call. Otherwise the keys are scanned with the
+        bit-parallel indel_ratio, skipping keys whose length rules out a win.
+
+        Args:
+            input_lower (str): The stripped, lowercased user input.
+
+        Returns:
+            Tuple[str, float]: The best response and its similarity score.
+        """
+        highest_similarity: float = 0.0
+        best_match: str = "Sorry, I didn't understand you."
+
+        # NATIVE MATCHING
+        if load_fuzzy_backend():
+            match = process.extractOne(input_lower, self._keys, scorer=fuzz.ratio,
+                                       processor=None, score_cutoff=SIMILARITY_THRESHOLD * 100)
+            if match is not None:
+                best_match = self._values[match[2]]
+                highest_similarity = match[1] / 100
+            return best_match, highest_similarity
+
+        # FALLBACK MATCHING
+        input_length: int = len(input_lower)
+        for response_value, key_length, key_masks in zip(self._values, self._key_lengths, self._key_masks):
+            # LENGTH PREFILTER: no ratio can exceed 2 * shorter / total length
+            upper_bound: float = 2 * min(input_length, key_length) / (input_length + key_length)
+            if upper_bound < SIMILARITY_THRESHOLD or upper_bound <= highest_similarity:
+                continue
+
+            similarity: float = indel_ratio(input_lower, key_length, key_masks)
+            if similarity > highest_similarity and similarity >= SIMILARITY_THRESHOLD:
+                highest_similarity = similarity
+                best_match = response_value
+
+        return best_match, highest_similarity
+
     def run(self) -> None:
         """
         Runs the interactive chatbot interface.
@@ -124,9 +293,7 @@ class ChatBot:
 
                 # EXIT CONDITION
                 if user_input.lower() in ['quit', 'exit', 'bye']:
-                    print(f"{SEPARATOR_LINE}")
-                    print(f"{SUCCESS_INDICATOR} Goodbye! Have a nice day!")
-                    print(f"{SEPARATOR_LINE}")
+                    sys.stdout.write(f"{self._separator}{SUCCESS_INDICATOR} Goodbye! Have a nice day!\n{self._separator}")
                     break
 
                 # RESPONSE PROCESSING
@@ -134,12 +301,12 @@ class ChatBot:
 
                 # SPECIAL RESPONSE HANDLING
                 if response == "GET_TIME":
+                    from datetime import datetime  # Only needed for time queries
                     response = f"The time is {datetime.now():%H:%M}"
 
-                # RESPONSE DISPLAY
-                print(f"{SEPARATOR_LINE}")
-                print(f"{self.name}: {response} (Similarity: {similarity:.2f})")
-                print(f"{SEPARATOR_LINE}")
+                # RESPONSE DISPLAY (one write per turn)
+                sys.stdout.write(f"{self._separator}{self._name_prefix}{response} "
+                                 f"(Similarity: {similarity:.2f})\n{self._separator}")
 
             # ERROR HANDLING
             except ValueError as ve:
@@ -170,8 +337,8 @@ def load_responses(file_path: str) -> Dict[str, str]:
             raise FileNotFoundError(f"Response file '{file_path}' not found")
 
         # JSON LOADING
-        with open(file_path, 'r', encoding='utf-8') as file:
-            responses: Dict[str, str] = json.load(file)
+        with open(file_path, 'rb') as file:
+            responses: Dict[str, str] = json_loads(file.read())
         return responses
 
     except json.JSONDecodeError:
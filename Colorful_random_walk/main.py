@@ -40,14 +40,12 @@ def random_color() -> tuple[int, int, int]:
         tuple[int, int, int]: A tuple of three integers representing RGB values (0-255).
 
     Raises:
-        None: The function uses random.randint, which is guaranteed to produce valid integers.
+        None: The function masks random bits to 0-255, so values are always valid.
     """
     # COLOR GENERATION
-    # Create random values for red, green, and blue components
-    r = random.randint(0, 255)
-    g = random.randint(0, 255)
-    b = random.randint(0, 255)
-    return r, g, b
+    # Draw all 24 bits in one call and split them into red, green, and blue
+    value = random.getrandbits(24)
+    return value >> 16, (value >> 8) & 0xFF, value & 0xFF
 
 
 # ============================================================================
@@ -57,12 +55,16 @@ def random_color() -> tuple[int, int, int]:
 # DIRECTION SETUP
 # Define possible movement directions (in degrees)
 directions = [0, 90, 180, 270]
+steps = 500  # Number of random-walk steps
+
+# Sample every heading up front in a single call
+headings = random.choices(directions, k=steps)
 
 # DRAWING LOOP
 # Execute 500 steps of random movement with random colors
-for _ in range(500):
+for heading in headings:
     to.forward(50)  # Move turtle forward by 50 units
-    to.setheading(random.choice(directions))  # Set random direction (0, 90, 180, or 270)
+    to.setheading(heading)  # Set random direction (0, 90, 180, or 270)
     to.pencolor(random_color())  # Set random pen color for the next segment
 
 # SCREEN INTERACTION
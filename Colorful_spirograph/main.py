@@ -40,11 +40,9 @@ def random_color():
         tuple: A tuple of three integers (R, G, B) between 0 and 255.
     """
     # COLOR GENERATION
-    # Create random values for red, green, and blue components
-    r = random.randint(0, 255)
-    g = random.randint(0, 255)
-    b = random.randint(0, 255)
-    return (r, g, b)
+    # Draw all 24 bits in one call and split them into red, green, and blue
+    value = random.getrandbits(24)
+    return value >> 16, (value >> 8) & 0xFF, value & 0xFF
 
 # ============================================================================
 # DRAWING LOGIC
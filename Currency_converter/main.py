@@ -13,8 +13,30 @@
 # Import required libraries
 import json  # For reading and writing JSON files
 import requests  # For making API requests to fetch exchange rates
+from requests.adapters import HTTPAdapter  # For connection pooling and retries
+from urllib3.util.retry import Retry  # For retrying transient server errors
 from typing import Dict, Tuple  # For type hints in function signatures
 
+# Optional Rust JSON serializer for faster rate saving
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ============================================================================
+# HTTP SESSION SETUP
+# ============================================================================
+
+# SHARED SESSION
+# Reuse one session so repeated API calls keep the connection (and TLS
+# handshake) alive, and retry transient server errors with backoff
+SESSION = requests.Session()
+_retry_adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3,
+                                               status_forcelist=[500, 502, 503, 504]))
+SESSION.mount("https://", _retry_adapter)
+SESSION.mount("http://", _retry_adapter)
+
 
 # ============================================================================
 # JSON HANDLING FUNCTIONS
@@ -50,7 +72,7 @@ def load_rates(json_file: str = "rates.json") -> Dict[str, dict]:
         if "eur" not in rates:
             raise ValueError("Error: JSON file missing 'eur' currency.")
 
-        return rates
+        return add_inverse_rates(rates)
 
     except FileNotFoundError:
         raise FileNotFoundError(f"Error: The file {json_file} was not found.")
@@ -73,9 +95,14 @@ def save_rates(rates: Dict[str, dict], json_file: str = "rates.json") -> None:
     """
     try:
         # FILE WRITING
-        # Save rates to JSON with readable formatting
-        with open(json_file, 'w') as file:
-            json.dump(rates, file, indent=4)
+        # Save rates to JSON with readable formatting (orjson when available); both
+        # branches use 2-space indentation, the only indent orjson supports
+        if orjson is not None:
+            with open(json_file, 'wb') as file:
+                file.write(orjson.dumps(rates, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w') as file:
+                json.dump(rates, file, indent=2)
         print(f"Saved rates to {json_file}")
 
     except IOError as e:
@@ -84,6 +111,24 @@ def save_rates(rates: Dict[str, dict], json_file: str = "rates.json") -> None:
         print(f"Error: Failed to save rates to {json_file}: {str(e)}")
 
 
+def add_inverse_rates(rates: Dict[str, dict]) -> Dict[str, dict]:
+    """
+    Store the reciprocal of every rate so conversions only need to multiply.
+
+    Args:
+        rates (Dict[str, dict]): Dictionary of currency codes and their exchange rates.
+
+    Returns:
+        Dict[str, dict]: The same dictionary, with an "inverse" entry added to each usable rate.
+    """
+    # RECIPROCAL PRECOMPUTATION
+    # Divide once per currency at load time; zero rates get no inverse and are rejected later
+    for info in rates.values():
+        if info.get("rate"):
+            info["inverse"] = 1.0 / info["rate"]
+    return rates
+
+
 # ============================================================================
 # API FETCHING FUNCTION
 # ============================================================================
@@ -105,8 +150,8 @@ def get_api_rates() -> Dict[str, dict]:
 
     try:
         # API REQUEST
-        # Fetch data with a timeout to prevent hanging
-        response = requests.get(url, timeout=5)
+        # Fetch data through the shared session with a timeout to prevent hanging
+        response = SESSION.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
 
@@ -135,7 +180,7 @@ def get_api_rates() -> Dict[str, dict]:
         # Store fetched rates to JSON for backup
         save_rates(rates)
 
-        return rates
+        return add_inverse_rates(rates)
 
     except requests.RequestException as e:
         raise ConnectionError(f"Error fetching API data: {str(e)}")
@@ -145,18 +190,17 @@ def get_api_rates() -> Dict[str, dict]:
 # CORE CONVERSION FUNCTION
 # ============================================================================
 
-def convert(amount: float, base: str, to: str, rates: Dict[str, dict]) -> float:
+def conversion_factor(base: str, to: str, rates: Dict[str, dict]) -> float:
     """
-    Convert an amount from one currency to another using provided exchange rates.
+    Compute the multiplier that converts one unit of the base currency to the target.
 
     Args:
-        amount (float): The amount to convert.
         base (str): The source currency code (e.g., "EUR").
         to (str): The target currency code (e.g., "DKK").
         rates (Dict[str, dict]): Dictionary of currency codes and their exchange rates.
 
     Returns:
-        float: The converted amount in the target currency.
+        float: The factor to multiply base-currency amounts by.
 
     Raises:
         ValueError: If either currency is not supported in the rates dictionary.
@@ -174,11 +218,32 @@ def convert(amount: float, base: str, to: str, rates: Dict[str, dict]) -> float:
         raise ValueError(f"Currency {base} not supported.")
     if not to_rates:
         raise ValueError(f"Currency {to} not supported.")
+    if "inverse" not in from_rates:
+        raise ValueError(f"Currency {base} has no usable rate.")
 
+    # FACTOR CALCULATION
+    # Rates are relative to EUR: multiply by the reciprocal precomputed at load time
+    return to_rates["rate"] * from_rates["inverse"]
+
+
+def convert(amount: float, base: str, to: str, rates: Dict[str, dict]) -> float:
+    """
+    Convert an amount from one currency to another using provided exchange rates.
+
+    Args:
+        amount (float): The amount to convert.
+        base (str): The source currency code (e.g., "EUR").
+        to (str): The target currency code (e.g., "DKK").
+        rates (Dict[str, dict]): Dictionary of currency codes and their exchange rates.
+
+    Returns:
+        float: The converted amount in the target currency.
+
+    Raises:
+        ValueError: If either currency is not supported in the rates dictionary.
+    """
     # CONVERSION CALCULATION
-    # Convert to EUR first (amount / base_rate), then to target (result * to_rate)
-    amount_in_eur = amount / from_rates["rate"]
-    return amount_in_eur * to_rates["rate"]
+    return amount * conversion_factor(base, to, rates)
 
 
 # ============================================================================
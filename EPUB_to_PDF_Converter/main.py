@@ -13,54 +13,890 @@
 import tkinter as tk  # For GUI creation
 from tkinter import filedialog, messagebox, ttk  # For file dialogs and UI components
 import os  # For file and directory operations
-import threading  # For background conversion to keep UI responsive
+import sys  # For interning generated anchor IDs
+import re  # For sanitizing book titles into file names
+import threading  # For unique cache file names per thread
+import multiprocessing  # For running the conversion outside the GUI process
+import queue  # For the empty-queue signal when relaying worker messages
+import signal  # For stopping a timed-out worker together with wkhtmltopdf
+import subprocess  # For stopping a timed-out worker's process tree on Windows
 import tempfile  # For temporary file management
+import io  # For building small books' HTML in memory
 import shutil  # For directory cleanup
 from pathlib import Path  # For path handling
-import time  # For delays and timeouts
+import time  # For conversion timeouts
+import functools  # For caching the wkhtmltopdf lookup
+from concurrent.futures import ThreadPoolExecutor  # For rendering several PDFs at once
+from typing import List, Optional, Set, Tuple  # For type hints in method signatures
+import hashlib  # For EPUB cache keys
+import importlib.util  # For checking that the lxml parser is installed
+import pickle  # For the on-disk EPUB parse cache
+from urllib.parse import unquote  # For decoding percent-encoded link paths
 
 try:
     import ebooklib  # For reading EPUB files
     from ebooklib import epub  # EPUB-specific functionality
     from bs4 import BeautifulSoup  # For HTML parsing and manipulation
+    if importlib.util.find_spec("lxml") is None:  # C-backed parser used by BeautifulSoup
+        raise ImportError("No module named 'lxml'")
     import pdfkit  # For PDF generation via wkhtmltopdf
 except ImportError as e:
     # ERROR FEEDBACK
     # Display installation instructions if dependencies are missing
     messagebox.showerror("Error", f"Missing required library: {e}\n\n"
                                   "Please install required packages:\n"
-                                  "pip install ebooklib beautifulsoup4 pdfkit\n\n"
+                                  "pip install ebooklib beautifulsoup4 lxml pdfkit\n\n"
                                   "Also install wkhtmltopdf:\n"
                                   "Windows: Download from https://wkhtmltopdf.org/downloads.html\n"
                                   "Linux: sudo apt-get install wkhtmltopdf\n"
                                   "macOS: brew install wkhtmltopdf")
     exit(1)
 
+# BeautifulSoup parser backend; lxml parses much faster than 'html.parser'
+HTML_PARSER = "lxml"
+
+# Seconds the worker may go without reporting progress before it is stopped; the
+# deadline restarts with every log line, so long books only fail if they stall
+CONVERSION_TIMEOUT = 600
+
+# Concurrent wkhtmltopdf processes when converting several books
+PDF_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+# Threads used to write extracted images to the temporary directory
+IMAGE_WRITE_WORKERS = 8
+
+# Characters removed from book titles before they become file names; \w matches
+# exactly what str.isalnum() accepts plus '_', so non-ASCII letters survive
+TITLE_UNSAFE_CHARS = re.compile(r"[^\w \-]+")
+
+# Books whose HTML stays below this many characters are piped to wkhtmltopdf's
+# stdin; larger ones are written to a temporary file and rendered from disk
+INLINE_HTML_LIMIT = 50_000_000
+
+# Parsed EPUB contents are cached here, keyed by path, mtime, and size
+EPUB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "epub2pdf")
+
+# Least recently used cache entries are deleted once the cache grows past this size
+EPUB_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Document head with the eBook-optimized stylesheet, shared by every conversion
+HTML_PROLOGUE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body { 
+            font-family: 'Palatino Linotype', Palatino, 'Book Antiqua', serif; 
+            font-size: 11pt;
+            line-height: 1.6; 
+            margin: 0.75in;
+            color: #000000;
+        }
+
+        /* HEADING STYLES */
+        /* Clear hierarchy with prevention of hanging titles via text flow */
+        h1, h2, h3, h4, h5, h6 { 
+            color: #000000; 
+            margin: 1.2em 0 0.6em;
+            font-weight: normal;
+            page-break-inside: avoid;
+            page-break-before: avoid;
+        }
+        h1 { 
+            font-size: 18pt; 
+            text-align: center;
+            margin-top: 1.5em;
+        }
+        h2 { font-size: 14pt; }
+        h3 { font-size: 12pt; }
+        h4 { font-size: 11pt; font-style: italic; }
+        h5, h6 { font-size: 10pt; }
+
+        /* PARAGRAPH STYLING */
+        /* Justified text with indent and enhanced flow control */
+        p { 
+            margin: 0 0 0.8em 0; 
+            text-align: justify;
+            text-indent: 1.5em;
+            orphans: 3;
+            widows: 3;
+            page-break-inside: avoid;
+        }
+
+        /* TITLE PAGE */
+        /* Centered title with significant top margin */
+        .title-page {
+            text-align: center;
+            margin-top: 40%;
+            font-size: 20pt;
+            page-break-after: always;
+        }
+
+        /* CHAPTER STYLING */
+        /* Page break before each chapter to match EPUB pagination */
+        .chapter {
+            page-break-before: always;
+            margin-top: 1em;
+            padding-top: 1em;
+        }
+
+        /* ANCHOR POSITIONING */
+        /* Ensure accurate link targets in PDF */
+        .anchor-target {
+            display: block;
+            position: relative;
+            top: -60px;
+            height: 0;
+            visibility: hidden;
+        }
+
+        /* IMAGE HANDLING */
+        /* Scale images to fit page without breaking */
+        img {
+            max-width: 85%;
+            height: auto;
+            display: block;
+            margin: 1em auto;
+            page-break-inside: avoid;
+            page-break-after: avoid;
+        }
+
+        /* LINK STYLING */
+        /* Subtle links for readability */
+        a {
+            text-decoration: none;
+            color: #003087;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+
+        /* ID ELEMENTS */
+        /* Ensure proper positioning for elements with IDs */
+        [id] {
+            position: relative;
+        }
+
+        /* BLOCK ELEMENTS */
+        /* Prevent breaks within quotes, code, tables, and lists */
+        blockquote, pre, table, ul, ol {
+            margin: 1em 0;
+            page-break-inside: avoid;
+            page-break-after: avoid;
+        }
+
+        /* TABLE STYLING */
+        /* Clean and minimal table design */
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 1em 0;
+            page-break-inside: avoid;
+        }
+        th, td {
+            border: 1px solid #e0e0e0;
+            padding: 8px;
+            text-align: left;
+        }
+        th {
+            background-color: #f8f8f8;
+            font-weight: bold;
+        }
+
+        /* LIST STYLING */
+        /* Consistent spacing for lists */
+        ul, ol {
+            padding-left: 2em;
+            margin: 1em 0;
+        }
+        li {
+            margin-bottom: 0.5em;
+            line-height: 1.6;
+        }
+
+        /* PRINT OPTIMIZATIONS */
+        /* Adjust margins and anchors for PDF output */
+        @media print {
+            body { 
+                margin: 0.75in; 
+                font-size: 10.5pt;
+            }
+            .anchor-target { top: -50px; }
+            .chapter { 
+                margin-top: 0.5em; 
+                padding-top: 0.5em; 
+            }
+        }
+    </style>
+</head>
+<body>"""
 
 # ============================================================================
 # WKHTMLTOPDF DETECTION FUNCTION
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def find_wkhtmltopdf() -> str:
     """
     Locate the wkhtmltopdf executable in common system paths.
 
+    The result is cached because the executable does not move while the app runs.
+
     Returns:
         str: Path to wkhtmltopdf executable, or empty string if not found.
     """
     # PATH SEARCH
-    # Check common installation paths for wkhtmltopdf
-    common_paths = [
+    # Prefer the copy on PATH (shutil.which honors PATHEXT on Windows), then
+    # fall back to the default install locations
+    known_paths = (
         r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe",
         r"C:\Program Files (x86)\wkhtmltopdf\bin\wkhtmltopdf.exe",
         "/usr/local/bin/wkhtmltopdf",
         "/usr/bin/wkhtmltopdf",
-        shutil.which("wkhtmltopdf")
-    ]
-    for path in common_paths:
-        if path and os.path.isfile(path):
-            return path
-    return ""
+    )
+    return shutil.which("wkhtmltopdf") or next((path for path in known_paths if os.path.isfile(path)), "")
+
+
+# ============================================================================
+# EPUB LOADING AND CACHING
+# ============================================================================
+
+def write_binary_file(path_and_content: Tuple[str, bytes]) -> None:
+    """
+    Write bytes to a file, replacing any existing file.
+
+    Args:
+        path_and_content (Tuple[str, bytes]): Destination path and the bytes to write.
+    """
+    path, content = path_and_content
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def unique_output_path(output_dir: str, title: str, taken: Set[str]) -> str:
+    """
+    Pick a PDF path for a book that no other book in the batch or existing file uses.
+
+    Args:
+        output_dir (str): Directory for the created PDFs.
+        title (str): The sanitized book title.
+        taken (Set[str]): Paths already assigned in this run; the chosen path is added.
+
+    Returns:
+        str: The output path, with a "_2", "_3", ... suffix when the title is taken.
+    """
+    output_path = os.path.join(output_dir, f"{title}.pdf")
+    counter = 2
+    while os.path.normcase(output_path) in taken or os.path.exists(output_path):
+        output_path = os.path.join(output_dir, f"{title}_{counter}.pdf")
+        counter += 1
+    taken.add(os.path.normcase(output_path))
+    return output_path
+
+
+def read_epub_contents(epub_file: str) -> dict:
+    """
+    Read the parts of an EPUB the converter needs into plain, picklable data.
+
+    Args:
+        epub_file (str): Path to the EPUB file.
+
+    Returns:
+        dict: "title" (str or None), "documents" and "images" as lists of
+            (name, content bytes), and "from_spine" (False if the spine could
+            not be read and all documents were used instead).
+    """
+    # EPUB PARSING
+    book = epub.read_epub(epub_file)
+    titles = book.get_metadata('DC', 'title')
+
+    # CONTENT ORDERING
+    # Use EPUB content in spine order
+    from_spine = True
+    try:
+        items = []
+        for item_id, _ in book.spine:
+            item = book.get_item_by_id(item_id)
+            if item:
+                items.append(item)
+    except:
+        items = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+        from_spine = False
+
+    return {
+        "title": titles[0][0] if titles else None,
+        "documents": [(item.get_name(), item.get_content()) for item in items],
+        "images": [(item.get_name(), item.get_content())
+                   for item in book.get_items_of_type(ebooklib.ITEM_IMAGE)],
+        "from_spine": from_spine,
+    }
+
+
+def load_epub_contents(epub_file: str) -> dict:
+    """
+    Load EPUB contents, reusing an on-disk cache when the file is unchanged.
+
+    The cache key covers the absolute path, modification time, and size, so an
+    edited or replaced EPUB is parsed again.
+
+    Args:
+        epub_file (str): Path to the EPUB file.
+
+    Returns:
+        dict: The contents as returned by read_epub_contents.
+    """
+    # CACHE KEY
+    # Identify this exact version of the file
+    stat = os.stat(epub_file)
+    key_source = f"{os.path.abspath(epub_file)}:{stat.st_mtime_ns}:{stat.st_size}"
+    cache_key = hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+    cache_path = os.path.join(EPUB_CACHE_DIR, f"{cache_key}.pkl")
+
+    # CACHE LOOKUP
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            contents = pickle.load(cache_file)
+        os.utime(cache_path)  # The mtime doubles as the LRU timestamp
+        return contents
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass  # Missing or unreadable cache entry: parse the EPUB instead
+
+    contents = read_epub_contents(epub_file)
+
+    # CACHE STORAGE
+    # Write to a temporary name first so readers never see a partial file
+    try:
+        os.makedirs(EPUB_CACHE_DIR, exist_ok=True)
+        partial_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(partial_path, 'wb') as cache_file:
+            pickle.dump(contents, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial_path, cache_path)
+        evict_epub_cache()
+    except OSError:
+        pass  # Caching is best effort; the conversion itself still works
+    return contents
+
+
+def evict_epub_cache() -> None:
+    """
+    Delete the least recently used cache entries until the cache fits EPUB_CACHE_MAX_BYTES.
+    """
+    entries = []
+    for entry in os.scandir(EPUB_CACHE_DIR):
+        if entry.is_file() and entry.name.endswith(".pkl"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= EPUB_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue  # Removed by another conversion meanwhile
+        total -= size
+
+
+# ============================================================================
+# CONVERSION WORKER
+# ============================================================================
+
+class ConversionWorker:
+    """
+    Tk-free conversion job that runs in a separate process.
+
+    Parsing is CPU-bound pure Python; running it in its own process keeps it from
+    holding the GIL the Tk main loop needs. Progress is reported through a
+    multiprocessing queue as (kind, text) tuples where kind is "log", "success",
+    or "error".
+    """
+    def __init__(self, epub_files: List[str], output_dir: str, wkhtmltopdf_path: str,
+                 temp_root: str, message_queue, verbose: bool = False) -> None:
+        """
+        Initialize the conversion job.
+
+        Args:
+            epub_files (List[str]): Paths of the EPUB files to convert.
+            output_dir (str): Directory for the created PDFs.
+            wkhtmltopdf_path (str): Path to the wkhtmltopdf executable.
+            temp_root (str): Directory owned by the GUI that holds every temporary directory.
+            message_queue: Queue receiving (kind, text) progress messages.
+            verbose (bool): Log every ID and link rewrite (slow on big books).
+        """
+        self.epub_files = epub_files
+        self.output_dir = output_dir
+        self.wkhtmltopdf_path = wkhtmltopdf_path
+        self.temp_root = temp_root
+        self.message_queue = message_queue
+        self.verbose = verbose
+        self._log_buffer = []  # Pending per-element debug lines
+
+    def log_message(self, message: str) -> None:
+        """
+        Send a message to the GUI log.
+
+        Args:
+            message (str): The message to log.
+        """
+        self.message_queue.put(("log", message))
+
+    def log_debug(self, message: str) -> None:
+        """
+        Buffer a per-element debug message; only kept when verbose logging is on.
+
+        Args:
+            message (str): The message to log.
+        """
+        if self.verbose:
+            self._log_buffer.append(message)
+
+    def flush_debug_log(self) -> None:
+        """
+        Write all buffered debug messages to the log in a single insert.
+        """
+        if self._log_buffer:
+            self.message_queue.put(("log", "\n".join(self._log_buffer)))
+            self._log_buffer = []
+
+    def run(self) -> None:
+        """
+        Convert the EPUB files to PDF, handling content, images, and links.
+
+        Books are turned into HTML one after another while already-built books are
+        rendered by a small pool of threads, each driving its own wkhtmltopdf process.
+        """
+        temp_dirs = []
+        output_paths = set()  # Output paths already assigned in this batch
+        created_paths = []
+        failed_files = []
+        try:
+            # INITIALIZATION
+            # Log start of conversion and prepare shared PDF settings
+            self.log_message("Starting conversion...")
+            os.makedirs(self.output_dir, exist_ok=True)
+            config = pdfkit.configuration(wkhtmltopdf=self.wkhtmltopdf_path)
+
+            # BATCH PROCESSING
+            # Build each book's HTML and hand it to the render pool right away
+            with ThreadPoolExecutor(max_workers=PDF_RENDER_WORKERS) as executor:
+                pending = []
+                for epub_file in self.epub_files:
+                    try:
+                        temp_dir = tempfile.mkdtemp(dir=self.temp_root)
+                        temp_dirs.append(temp_dir)
+                        self.log_message(f"Created temporary directory: {temp_dir}")
+                        title, html, temp_html_path = self.build_html(epub_file, temp_dir)
+                        output_path = unique_output_path(self.output_dir, title, output_paths)
+                        future = executor.submit(self.render_pdf, html, temp_html_path, output_path, config)
+                        pending.append((epub_file, future))
+                    except Exception as e:
+                        self.log_message(f"Error converting {os.path.basename(epub_file)}: {str(e)}")
+                        failed_files.append(epub_file)
+
+                # RESULT COLLECTION
+                # Wait for every render and record which books failed
+                for epub_file, future in pending:
+                    try:
+                        created_paths.append(future.result())
+                    except Exception as e:
+                        self.log_message(f"Error converting {os.path.basename(epub_file)}: {str(e)}")
+                        failed_files.append(epub_file)
+
+            if failed_files:
+                raise Exception(f"{len(failed_files)} of {len(self.epub_files)} book(s) failed; see the log for details")
+
+            # SUCCESS FEEDBACK
+            # Notify user of successful conversion
+            saved_list = "\n".join(created_paths)
+            self.log_message("Conversion completed successfully!")
+            self.message_queue.put(("success", saved_list))
+
+        except Exception as e:
+            # ERROR HANDLING
+            # Log and display any conversion errors
+            error_msg = f"Error during conversion: {str(e)}"
+            self.log_message(error_msg)
+            self.message_queue.put(("error", error_msg))
+
+        finally:
+            # CLEANUP
+            # Remove temporary directories (images and HTML live inside them); every
+            # wkhtmltopdf process has exited by now because pdfkit waits for it
+            for temp_dir in temp_dirs:
+                if os.path.exists(temp_dir):
+                    try:
+                        shutil.rmtree(temp_dir, ignore_errors=True)
+                        self.log_message("Cleaned up temporary directory")
+                    except OSError as e:
+                        self.log_message(f"Error cleaning up temp directory: {e}")
+
+    def build_html(self, epub_file: str, temp_dir: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Turn one EPUB file into a single styled HTML document ready for wkhtmltopdf.
+
+        The document is kept in memory unless it grows past INLINE_HTML_LIMIT, in
+        which case it is written to a file in temp_dir.
+
+        Args:
+            epub_file (str): Path to the EPUB file.
+            temp_dir (str): Temporary directory for extracted images and large HTML files.
+
+        Returns:
+            Tuple[str, Optional[str], Optional[str]]: The sanitized book title, the
+            HTML text (None if spilled to disk), and the HTML file path (None if in memory).
+        """
+        # INITIALIZATION
+        # Load EPUB (from the parse cache when the file is unchanged)
+        self.log_message("Loading EPUB file...")
+        contents = load_epub_contents(epub_file)
+        self.log_message(f"Loaded EPUB: {os.path.basename(epub_file)}")
+
+        # METADATA EXTRACTION
+        # Extract book title for output file naming
+        title = "converted_book"
+        if contents["title"]:
+            title = contents["title"]
+            title = TITLE_UNSAFE_CHARS.sub("", title).rstrip()
+        self.log_message(f"Extracted title: {title}")
+
+        # CONTENT ORDERING
+        # Process EPUB content in spine order
+        self.log_message("Processing EPUB content using spine...")
+        items = contents["documents"]
+        if contents["from_spine"]:
+            self.log_message(f"Found {len(items)} spine items")
+        else:
+            self.log_message(f"Fallback: Found {len(items)} document items")
+
+        # PHASE 1: LINK AND ID MAPPING
+        # Build maps for IDs and links to handle internal references
+        self.log_message("Phase 1: Building ID and link maps...")
+        file_to_index = {}  # Map filename to item index
+        all_ids = {}  # Map original_id -> (file_index, new_id)
+        all_links = []  # List of (file_index, original_href)
+        referenced_images = set()  # File names of the images any <img> points at
+        parsed_soups = []  # Parsed documents, reused in Phase 2
+        file_start_ids = [sys.intern(f"file{i}_start") for i in range(len(items))]  # Chapter anchors
+
+        for i, (item_name, item_content) in enumerate(items):
+            file_to_index[item_name] = i
+            soup = BeautifulSoup(item_content, HTML_PARSER)
+            parsed_soups.append(soup)
+
+            # ID AND LINK COLLECTION
+            # Find all elements with IDs and all links in a single tree walk
+            for element in soup.descendants:
+                if element.name is None:
+                    continue  # Text node
+                if element.has_attr('id'):
+                    original_id = element['id']
+                    new_id = sys.intern(f"file{i}_{original_id}")
+                    all_ids[original_id] = (i, new_id)
+                    self.log_debug(f"Found ID: {original_id} -> {new_id} in file {i}")
+                if element.name == 'a' and element.has_attr('href'):
+                    href = element['href']
+                    all_links.append((i, href))  # No element refs, so finished trees can be freed
+                elif element.name == 'img':
+                    src = element.get('src')
+                    if src:
+                        referenced_images.add(os.path.basename(unquote(src)))
+
+        self.flush_debug_log()
+        self.log_message(f"Found {len(all_ids)} unique IDs and {len(all_links)} links")
+
+        # IMAGE EXTRACTION
+        # Save only the images the content references to the temporary directory;
+        # file writes release the GIL, so a few threads overlap the disk latency.
+        # Images land in temp_dir under their file name, so the map is keyed by it
+        # and any relative src ("../Images/a.png", "a.png") resolves in one lookup
+        self.log_message("Extracting images...")
+        image_map = {}  # Map image file name -> extracted path
+        image_writes = []
+        for image_item_name, image_content in contents["images"]:
+            image_name = os.path.basename(image_item_name)
+            if image_name not in referenced_images:
+                continue  # Never shown, so never written
+            image_path = os.path.join(temp_dir, image_name)
+            image_map[image_name] = image_path
+            image_writes.append((image_path, image_content))
+        with ThreadPoolExecutor(max_workers=IMAGE_WRITE_WORKERS) as executor:
+            list(executor.map(write_binary_file, image_writes))
+        self.log_message(f"Extracted {len(image_map)} of {len(contents['images'])} images")
+
+        # FILE LOOKUP INDEX
+        # Map every path suffix (e.g. "Text/ch1.xhtml" and "ch1.xhtml") to its
+        # item so file links resolve with one dict lookup; first item wins
+        suffix_to_index = {}
+        for file_name, file_index in file_to_index.items():
+            parts = file_name.split('/')
+            for start in range(len(parts)):
+                suffix_to_index.setdefault('/'.join(parts[start:]), file_index)
+
+        # PHASE 2: CONTENT PROCESSING
+        # Process content with eBook-optimized styling and chapter breaks
+        self.log_message("Phase 2: Processing content with eBook-optimized styling...")
+
+        # HTML ASSEMBLY
+        # Write each processed piece to an in-memory buffer so the book can be piped
+        # to wkhtmltopdf; once it passes INLINE_HTML_LIMIT, move it to a file on disk
+        self.log_message("Assembling HTML...")
+        html_buffer = io.StringIO()
+        html_file = html_buffer
+        temp_html_path = None
+
+        def write_html(fragment: str) -> None:
+            nonlocal html_file, temp_html_path
+            html_file.write(fragment)
+            html_file.write('\n')
+            if html_file is html_buffer and html_buffer.tell() > INLINE_HTML_LIMIT:
+                temp_html_path = os.path.join(temp_dir, "book.html")
+                self.log_message(f"HTML exceeds in-memory limit, writing to: {temp_html_path}")
+                html_file = open(temp_html_path, 'w', encoding='utf-8')
+                html_file.write(html_buffer.getvalue())
+                html_buffer.close()
+
+        try:
+            write_html(HTML_PROLOGUE)
+            write_html(f'<div class="title-page"><h1>{title}</h1></div>')
+
+            for i, (item_name, _) in enumerate(items):
+                # CONTENT PROCESSING
+                # Process each EPUB item in spine order
+                self.log_message(f"Processing item {i + 1}/{len(items)}: {item_name}")
+                soup = parsed_soups[i]
+                parsed_soups[i] = None  # Release the tree once this item is serialized
+
+                # TREE WALK
+                # Collect scripts, images, IDs, and links in one pass over the tree;
+                # the rewrites below run afterwards so the walk never sees a mutated tree
+                scripts = []
+                images = []
+                id_elements = []
+                links = []
+                for element in soup.descendants:
+                    name = element.name
+                    if name is None:
+                        continue  # Text node
+                    if name == 'script':
+                        scripts.append(element)
+                        continue
+                    if name == 'img':
+                        images.append(element)
+                    elif name == 'a' and element.has_attr('href'):
+                        links.append(element)
+                    if element.has_attr('id'):
+                        id_elements.append(element)
+
+                # SCRIPT REMOVAL
+                # Remove scripts to prevent rendering issues
+                for script in scripts:
+                    script.decompose()
+
+                # IMAGE PATH FIXING
+                # Point image sources at the temporary files as file:// URLs; HTML piped
+                # through stdin has no base URL, so bare OS paths would not resolve
+                for img in images:
+                    src = img.get('src')
+                    if src:
+                        image_path = image_map.get(os.path.basename(unquote(src)))
+                        if image_path is not None:
+                            img['src'] = Path(image_path).as_uri()
+
+                # ID HANDLING
+                # Update IDs for PDF-compatible anchors
+                for element in id_elements:
+                    original_id = element['id']
+                    if original_id in all_ids:
+                        _, new_id = all_ids[original_id]
+                        anchor_span = soup.new_tag('span', **{'class': 'anchor-target', 'id': new_id})
+                        element.insert_before(anchor_span)
+                        del element['id']
+                        self.log_debug(f"Created anchor target: {original_id} -> {new_id}")
+
+                # LINK HANDLING
+                # Fix internal links for PDF navigation
+                broken_links = []  # Marked in one sweep after every link is resolved
+                for link in links:
+                    href = link['href']
+                    original_href = href
+                    self.log_debug(f"Processing link: {href}")
+
+                    try:
+                        if href.startswith('#'):
+                            target_id = href[1:]
+                            if target_id in all_ids:
+                                _, new_id = all_ids[target_id]
+                                link['href'] = f"#{new_id}"
+                                self.log_debug(f"Updated anchor link: {href} -> #{new_id}")
+                            else:
+                                self.log_debug(f"Warning: Anchor target not found: {target_id}")
+                                broken_links.append(link)
+
+                        elif '#' in href:
+                            file_part, anchor_part = href.split('#', 1)
+                            if anchor_part in all_ids:
+                                _, new_id = all_ids[anchor_part]
+                                link['href'] = f"#{new_id}"
+                                self.log_debug(f"Updated file+anchor link: {href} -> #{new_id}")
+                            else:
+                                self.log_debug(f"Warning: Cross-file anchor not found: {anchor_part}")
+                                broken_links.append(link)
+
+                        else:
+                            if not href.startswith(('http://', 'https://', 'mailto:', 'ftp://')):
+                                link_path = unquote(href)
+                                target_file_index = suffix_to_index.get(link_path)
+                                if target_file_index is None:
+                                    target_file_index = suffix_to_index.get(os.path.basename(link_path))
+                                if target_file_index is not None:
+                                    chapter_id = file_start_ids[target_file_index]
+                                    link['href'] = f"#{chapter_id}"
+                                    self.log_debug(f"Updated file link: {href} -> #{chapter_id}")
+                                else:
+                                    self.log_debug(f"Warning: File target not found: {href}")
+                                    broken_links.append(link)
+
+                    except Exception as e:
+                        self.log_message(f"Error processing link {original_href}: {str(e)}")
+                        broken_links.append(link)
+
+                # BROKEN LINK MARKING
+                # Tag unresolved links so they can be styled; the class list is
+                # extended in place instead of being copied per link
+                for link in broken_links:
+                    classes = link.get('class') or []
+                    classes.append('broken-link')
+                    link['class'] = classes
+
+                # CHAPTER MARKERS
+                # Add chapter divs with anchors
+                chapter_open = '<div class="chapter">' if i > 0 else '<div>'
+                write_html(f'{chapter_open}\n<span class="anchor-target" id="{file_start_ids[i]}"></span>')
+
+                # CONTENT INCLUSION
+                # Add processed HTML content; the body is serialized in one call,
+                # which also keeps text that sits directly under <body>
+                if soup.body:
+                    write_html(soup.body.decode_contents())
+                else:
+                    write_html(str(soup))
+
+                write_html('</div>')
+                self.flush_debug_log()
+
+            write_html("</body></html>")
+        finally:
+            if html_file is not html_buffer:
+                html_file.close()
+
+        if temp_html_path is not None:
+            self.log_message(f"Temporary HTML file created: {temp_html_path}")
+            return title, None, temp_html_path
+        self.log_message("HTML assembled in memory")
+        return title, html_buffer.getvalue(), None
+
+    def render_pdf(self, html: Optional[str], temp_html_path: Optional[str], output_path: str, config) -> str:
+        """
+        Render a prepared HTML document to PDF with wkhtmltopdf.
+
+        In-memory HTML is piped to wkhtmltopdf's stdin; spilled HTML is read from disk.
+
+        Args:
+            html (Optional[str]): HTML text built by build_html, or None if spilled to disk.
+            temp_html_path (Optional[str]): Path of the spilled HTML file, or None.
+            output_path (str): Destination PDF path.
+            config: The pdfkit configuration pointing at wkhtmltopdf.
+
+        Returns:
+            str: The output path of the created PDF.
+
+        Raises:
+            Exception: If wkhtmltopdf fails or no PDF is written.
+        """
+        # PDF OUTPUT
+        # Generate PDF from HTML
+        self.log_message(f"Generating PDF at: {output_path}")
+
+        # PDF CONFIGURATION
+        # Set options for wkhtmltopdf
+        options = {
+            'page-size': 'A4',
+            'margin-top': '0.75in',
+            'margin-right': '0.75in',
+            'margin-bottom': '0.75in',
+            'margin-left': '0.75in',
+            'encoding': "UTF-8",
+            'no-outline': None,
+            'enable-local-file-access': None,
+            'disable-smart-shrinking': None,
+            'image-dpi': 300,
+            'image-quality': 100,
+            'enable-internal-links': None,
+            'print-media-type': None,
+            'zoom': 1.0,
+            'disable-javascript': None,
+            'load-error-handling': 'ignore',
+            'load-media-error-handling': 'ignore'
+        }
+
+        self.log_message("Starting PDF conversion...")
+        try:
+            if temp_html_path is not None:
+                pdfkit.from_file(temp_html_path, output_path, options=options, configuration=config)
+            else:
+                pdfkit.from_string(html, output_path, options=options, configuration=config)
+            self.log_message("PDF conversion completed")
+        except Exception as e:
+            self.log_message(f"PDF conversion failed: {str(e)}")
+            raise
+
+        # OUTPUT VERIFICATION
+        # Check if PDF was created successfully
+        if os.path.exists(output_path):
+            file_size = os.path.getsize(output_path)
+            self.log_message(f"PDF created successfully! Size: {file_size} bytes")
+        else:
+            raise Exception("PDF file was not created")
+        return output_path
+
+
+def run_conversion_worker(epub_files: List[str], output_dir: str, wkhtmltopdf_path: str,
+                          temp_root: str, message_queue, verbose: bool = False) -> None:
+    """
+    Process entry point: run a ConversionWorker for the given files.
+
+    Args:
+        epub_files (List[str]): Paths of the EPUB files to convert.
+        output_dir (str): Directory for the created PDFs.
+        wkhtmltopdf_path (str): Path to the wkhtmltopdf executable.
+        temp_root (str): Directory owned by the GUI that holds every temporary directory.
+        message_queue: Queue receiving (kind, text) progress messages.
+        verbose (bool): Log every ID and link rewrite.
+    """
+    # PROCESS GROUP
+    # Lead a new group so a timeout can stop the worker and its wkhtmltopdf children together
+    if hasattr(os, "setsid"):
+        os.setsid()
+    ConversionWorker(epub_files, output_dir, wkhtmltopdf_path, temp_root, message_queue, verbose).run()
+
+
+def kill_process_tree(process) -> None:
+    """
+    Stop a conversion process together with any wkhtmltopdf processes it started.
+
+    Args:
+        process: The conversion process started by the GUI.
+    """
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            process.kill()  # The worker had not started its own group yet
+    process.join(timeout=5)
 
 
 # ============================================================================
@@ -81,8 +917,9 @@ class EPUBtoPDFConverter:
         self.root.title("EPUB to PDF Converter")
         self.root.geometry("500x350")
         self.root.resizable(True, True)
-        self.epub_file = ""
+        self.epub_files = []
         self.output_dir = ""
+        self.verbose = False  # Log every ID and link rewrite (slow on big books)
         self.wkhtmltopdf_path = find_wkhtmltopdf()
         self.setup_gui()
         self.check_dependencies()
@@ -122,7 +959,7 @@ class EPUBtoPDFConverter:
 
         # EPUB FILE INPUT
         # Create input field and browse button for EPUB file
-        ttk.Label(main_frame, text="EPUB File:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        ttk.Label(main_frame, text="EPUB File(s):").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.epub_path_var = tk.StringVar()
         epub_entry = ttk.Entry(main_frame, textvariable=self.epub_path_var, width=40)
         epub_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=5)
@@ -170,19 +1007,19 @@ class EPUBtoPDFConverter:
 
     def browse_epub_file(self) -> None:
         """
-        Open a file dialog to select an EPUB file and set the output directory.
+        Open a file dialog to select one or more EPUB files and set the output directory.
         """
         # FILE SELECTION
-        # Prompt user to select an EPUB file
-        file_path = filedialog.askopenfilename(
-            title="Select EPUB file",
+        # Prompt user to select EPUB files; several can be converted in one batch
+        file_paths = filedialog.askopenfilenames(
+            title="Select EPUB file(s)",
             filetypes=[("EPUB files", "*.epub"), ("All files", "*.*")]
         )
-        if file_path:
-            self.epub_file = file_path
-            self.epub_path_var.set(file_path)
+        if file_paths:
+            self.epub_files = list(file_paths)
+            self.epub_path_var.set("; ".join(self.epub_files))
             if not self.output_dir:
-                self.output_dir = os.path.dirname(file_path)
+                self.output_dir = os.path.dirname(self.epub_files[0])
                 self.output_path_var.set(self.output_dir)
 
     def browse_output_dir(self) -> None:
@@ -198,27 +1035,38 @@ class EPUBtoPDFConverter:
 
     def log_message(self, message: str) -> None:
         """
-        Log a message to the GUI's text area and update the display.
+        Log a message to the GUI's text area.
+
+        The insert is scheduled on the Tk main loop instead of forcing a redraw
+        for every line.
 
         Args:
             message (str): The message to log.
         """
         # LOGGING
-        # Append message to log window and scroll to end
-        self.log_text.insert(tk.END, f"{message}\n")
+        # Queue the append; Tk redraws on its own schedule
+        self.root.after(0, self._append_log_text, f"{message}\n")
+
+    def _append_log_text(self, text: str) -> None:
+        """
+        Append text to the log window and scroll to the end (Tk main thread only).
+
+        Args:
+            text (str): The text to append, including trailing newline.
+        """
+        self.log_text.insert(tk.END, text)
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
 
     def start_conversion(self) -> None:
         """
-        Start the EPUB to PDF conversion in a separate thread.
+        Start the EPUB to PDF conversion in a separate process.
         """
         # VALIDATION
         # Check for wkhtmltopdf, EPUB file, and output directory
         if not self.wkhtmltopdf_path:
             messagebox.showerror("Error", "wkhtmltopdf not found. Please install wkhtmltopdf.")
             return
-        if not self.epub_file or not os.path.exists(self.epub_file):
+        if not self.epub_files or not all(os.path.exists(path) for path in self.epub_files):
             messagebox.showerror("Error", "Please select a valid EPUB file")
             return
         if not self.output_dir:
@@ -226,471 +1074,95 @@ class EPUBtoPDFConverter:
             return
 
         # UI UPDATE
-        # Disable button, start progress bar, and launch conversion thread
+        # Disable button, start progress bar, and launch conversion process
         self.convert_btn.config(state='disabled')
         self.progress.start()
         self.status_var.set("Converting...")
-        thread = threading.Thread(target=self.convert_epub_to_pdf)
-        thread.daemon = True
-        thread.start()
-        self.root.after(100, lambda: self.check_thread(thread, time.time()))
+        epub_files = list(self.epub_files)
+        temp_root = tempfile.mkdtemp(prefix="epub2pdf_")  # Removed here even if the worker is killed
+        context = multiprocessing.get_context('spawn')
+        message_queue = context.Queue()
+        process = context.Process(
+            target=run_conversion_worker,
+            args=(epub_files, self.output_dir, self.wkhtmltopdf_path, temp_root, message_queue, self.verbose),
+            daemon=True
+        )
+        process.start()
+        deadline = time.time() + CONVERSION_TIMEOUT
+        self.root.after(100, lambda: self.check_process(process, message_queue, deadline, temp_root))
 
-    def check_thread(self, thread, start_time):
+    def check_process(self, process, message_queue, deadline, temp_root) -> None:
         """
-        Monitor the conversion thread and handle timeouts.
+        Relay worker messages to the GUI and handle completion and timeouts.
 
         Args:
-            thread: The running conversion thread.
-            start_time: The time the conversion started.
-        """
-        # THREAD MONITORING
-        # Check if thread is still running or has timed out
-        if thread.is_alive():
-            if time.time() - start_time > 60:  # 60-second timeout
-                self.log_message("Conversion timed out after 60 seconds")
+            process: The running conversion process.
+            message_queue: Queue the worker reports progress on.
+            deadline: The time after which a worker that has stopped reporting is stopped.
+            temp_root: The temporary directory handed to the worker.
+        """
+        # MESSAGE RELAY
+        # Any message counts as progress and restarts the timeout
+        if self.drain_worker_messages(message_queue):
+            deadline = time.time() + CONVERSION_TIMEOUT
+
+        # PROCESS MONITORING
+        # Check if the process is still running or has stalled
+        if process.is_alive():
+            if time.time() > deadline:
+                kill_process_tree(process)  # Unlike a thread, the process can really be stopped
+                self.log_message(f"Conversion timed out after {CONVERSION_TIMEOUT} seconds without progress")
                 self.status_var.set("Conversion failed")
-                self.root.after(0, lambda: messagebox.showerror("Error", "Conversion timed out"))
-                thread.join(timeout=1)  # Force join with small timeout
-                self.finish_conversion()
+                messagebox.showerror("Error", "Conversion timed out")
+                self.finish_conversion(temp_root)
             else:
-                self.root.after(100, lambda: self.check_thread(thread, start_time))
+                self.root.after(100, lambda: self.check_process(process, message_queue, deadline, temp_root))
         else:
-            self.finish_conversion()
+            self.drain_worker_messages(message_queue)
+            self.finish_conversion(temp_root)
 
-    def convert_epub_to_pdf(self) -> None:
+    def drain_worker_messages(self, message_queue) -> int:
         """
-        Convert the EPUB file to PDF, handling content, images, and links.
-        """
-        temp_dir = None
-        temp_html_path = None
-        try:
-            # INITIALIZATION
-            # Log start of conversion and load EPUB
-            self.log_message("Starting conversion...")
-            self.log_message("Loading EPUB file...")
-            book = epub.read_epub(self.epub_file)
-            self.log_message(f"Loaded EPUB: {os.path.basename(self.epub_file)}")
-
-            # METADATA EXTRACTION
-            # Extract book title for output file naming
-            title = "converted_book"
-            if book.get_metadata('DC', 'title'):
-                title = book.get_metadata('DC', 'title')[0][0]
-                title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            self.log_message(f"Extracted title: {title}")
-
-            # TEMP DIRECTORY SETUP
-            # Create temporary directory for images and HTML
-            temp_dir = tempfile.mkdtemp()
-            self.log_message(f"Created temporary directory: {temp_dir}")
-
-            # IMAGE EXTRACTION
-            # Save EPUB images to temporary directory
-            self.log_message("Extracting images...")
-            image_map = {}
-            for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
-                image_name = os.path.basename(item.get_name())
-                image_path = os.path.join(temp_dir, image_name)
-                with open(image_path, 'wb') as f:
-                    f.write(item.get_content())
-                image_map[item.get_name()] = image_path
-            self.log_message(f"Extracted {len(image_map)} images")
-
-            # CONTENT ORDERING
-            # Process EPUB content in spine order
-            self.log_message("Processing EPUB content using spine...")
-            try:
-                spine_items = []
-                for item_id, _ in book.spine:
-                    item = book.get_item_by_id(item_id)
-                    if item:
-                        spine_items.append(item)
-                items = spine_items
-                self.log_message(f"Found {len(items)} spine items")
-            except:
-                items = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
-                self.log_message(f"Fallback: Found {len(items)} document items")
-
-            # PHASE 1: LINK AND ID MAPPING
-            # Build maps for IDs and links to handle internal references
-            self.log_message("Phase 1: Building ID and link maps...")
-            file_to_index = {}  # Map filename to item index
-            all_ids = {}  # Map original_id -> (file_index, new_id)
-            all_links = []  # List of (file_index, link_element, original_href)
-
-            for i, item in enumerate(items):
-                file_to_index[item.get_name()] = i
-                soup = BeautifulSoup(item.get_content(), 'html.parser')
-
-                # ID COLLECTION
-                # Find all elements with IDs
-                for element in soup.find_all(attrs={'id': True}):
-                    original_id = element['id']
-                    new_id = f"file{i}_{original_id}"
-                    all_ids[original_id] = (i, new_id)
-                    self.log_message(f"Found ID: {original_id} -> {new_id} in file {i}")
-
-                # LINK COLLECTION
-                # Find all internal links
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    all_links.append((i, link, href))
-
-            self.log_message(f"Found {len(all_ids)} unique IDs and {len(all_links)} links")
-
-            # PHASE 2: CONTENT PROCESSING
-            # Process content with eBook-optimized styling and chapter breaks
-            self.log_message("Phase 2: Processing content with eBook-optimized styling...")
-
-            content_html = ["""<!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            body { 
-                font-family: 'Palatino Linotype', Palatino, 'Book Antiqua', serif; 
-                font-size: 11pt;
-                line-height: 1.6; 
-                margin: 0.75in;
-                color: #000000;
-            }
-
-            /* HEADING STYLES */
-            /* Clear hierarchy with prevention of hanging titles via text flow */
-            h1, h2, h3, h4, h5, h6 { 
-                color: #000000; 
-                margin: 1.2em 0 0.6em;
-                font-weight: normal;
-                page-break-inside: avoid;
-                page-break-before: avoid;
-            }
-            h1 { 
-                font-size: 18pt; 
-                text-align: center;
-                margin-top: 1.5em;
-            }
-            h2 { font-size: 14pt; }
-            h3 { font-size: 12pt; }
-            h4 { font-size: 11pt; font-style: italic; }
-            h5, h6 { font-size: 10pt; }
-
-            /* PARAGRAPH STYLING */
-            /* Justified text with indent and enhanced flow control */
-            p { 
-                margin: 0 0 0.8em 0; 
-                text-align: justify;
-                text-indent: 1.5em;
-                orphans: 3;
-                widows: 3;
-                page-break-inside: avoid;
-            }
-
-            /* TITLE PAGE */
-            /* Centered title with significant top margin */
-            .title-page {
-                text-align: center;
-                margin-top: 40%;
-                font-size: 20pt;
-                page-break-after: always;
-            }
-
-            /* CHAPTER STYLING */
-            /* Page break before each chapter to match EPUB pagination */
-            .chapter {
-                page-break-before: always;
-                margin-top: 1em;
-                padding-top: 1em;
-            }
-
-            /* ANCHOR POSITIONING */
-            /* Ensure accurate link targets in PDF */
-            .anchor-target {
-                display: block;
-                position: relative;
-                top: -60px;
-                height: 0;
-                visibility: hidden;
-            }
-
-            /* IMAGE HANDLING */
-            /* Scale images to fit page without breaking */
-            img {
-                max-width: 85%;
-                height: auto;
-                display: block;
-                margin: 1em auto;
-                page-break-inside: avoid;
-                page-break-after: avoid;
-            }
-
-            /* LINK STYLING */
-            /* Subtle links for readability */
-            a {
-                text-decoration: none;
-                color: #003087;
-            }
-            a:hover {
-                text-decoration: underline;
-            }
-
-            /* ID ELEMENTS */
-            /* Ensure proper positioning for elements with IDs */
-            [id] {
-                position: relative;
-            }
-
-            /* BLOCK ELEMENTS */
-            /* Prevent breaks within quotes, code, tables, and lists */
-            blockquote, pre, table, ul, ol {
-                margin: 1em 0;
-                page-break-inside: avoid;
-                page-break-after: avoid;
-            }
-
-            /* TABLE STYLING */
-            /* Clean and minimal table design */
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 1em 0;
-                page-break-inside: avoid;
-            }
-            th, td {
-                border: 1px solid #e0e0e0;
-                padding: 8px;
-                text-align: left;
-            }
-            th {
-                background-color: #f8f8f8;
-                font-weight: bold;
-            }
-
-            /* LIST STYLING */
-            /* Consistent spacing for lists */
-            ul, ol {
-                padding-left: 2em;
-                margin: 1em 0;
-            }
-            li {
-                margin-bottom: 0.5em;
-                line-height: 1.6;
-            }
-
-            /* PRINT OPTIMIZATIONS */
-            /* Adjust margins and anchors for PDF output */
-            @media print {
-                body { 
-                    margin: 0.75in; 
-                    font-size: 10.5pt;
-                }
-                .anchor-target { top: -50px; }
-                .chapter { 
-                    margin-top: 0.5em; 
-                    padding-top: 0.5em; 
-                }
-            }
-        </style>
-    </head>
-    <body>"""]
-
-            content_html.append(f'<div class="title-page"><h1>{title}</h1></div>')
-
-            for i, item in enumerate(items):
-                # CONTENT PROCESSING
-                # Process each EPUB item in spine order
-                self.log_message(f"Processing item {i + 1}/{len(items)}: {item.get_name()}")
-                soup = BeautifulSoup(item.get_content(), 'html.parser')
-
-                # SCRIPT REMOVAL
-                # Remove scripts to prevent rendering issues
-                for script in soup(["script"]):
-                    script.decompose()
-
-                # IMAGE PATH FIXING
-                # Update image sources to point to temporary files
-                for img in soup.find_all('img'):
-                    src = img.get('src')
-                    if src:
-                        if src.startswith('../'):
-                            src = src[3:]
-                        if src in image_map:
-                            img['src'] = image_map[src]
-
-                # ID HANDLING
-                # Update IDs for PDF-compatible anchors
-                for element in soup.find_all(attrs={'id': True}):
-                    original_id = element['id']
-                    if original_id in all_ids:
-                        _, new_id = all_ids[original_id]
-                        anchor_span = soup.new_tag('span', **{'class': 'anchor-target', 'id': new_id})
-                        element.insert_before(anchor_span)
-                        del element['id']
-                        self.log_message(f"Created anchor target: {original_id} -> {new_id}")
-
-                # LINK HANDLING
-                # Fix internal links for PDF navigation
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    original_href = href
-                    self.log_message(f"Processing link: {href}")
-
-                    try:
-                        if href.startswith('#'):
-                            target_id = href[1:]
-                            if target_id in all_ids:
-                                _, new_id = all_ids[target_id]
-                                link['href'] = f"#{new_id}"
-                                self.log_message(f"Updated anchor link: {href} -> #{new_id}")
-                            else:
-                                self.log_message(f"Warning: Anchor target not found: {target_id}")
-                                link['class'] = link.get('class', []) + ['broken-link']
-
-                        elif '#' in href:
-                            file_part, anchor_part = href.split('#', 1)
-                            if anchor_part in all_ids:
-                                _, new_id = all_ids[anchor_part]
-                                link['href'] = f"#{new_id}"
-                                self.log_message(f"Updated file+anchor link: {href} -> #{new_id}")
-                            else:
-                                self.log_message(f"Warning: Cross-file anchor not found: {anchor_part}")
-                                link['class'] = link.get('class', []) + ['broken-link']
-
-                        else:
-                            if not href.startswith(('http://', 'https://', 'mailto:', 'ftp://')):
-                                target_file_index = None
-                                for file_name, file_index in file_to_index.items():
-                                    if file_name.endswith(href) or href in file_name:
-                                        target_file_index = file_index
-                                        break
-                                if target_file_index is not None:
-                                    chapter_id = f"file{target_file_index}_start"
-                                    link['href'] = f"#{chapter_id}"
-                                    self.log_message(f"Updated file link: {href} -> #{chapter_id}")
-                                else:
-                                    self.log_message(f"Warning: File target not found: {href}")
-                                    link['class'] = link.get('class', []) + ['broken-link']
-
-                    except Exception as e:
-                        self.log_message(f"Error processing link {original_href}: {str(e)}")
-                        link['class'] = link.get('class', []) + ['broken-link']
+        Handle every message the worker has queued so far without blocking.
 
-                # CHAPTER MARKERS
-                # Add chapter divs with anchors
-                if i > 0:
-                    content_html.append(f'<div class="chapter">')
-                    content_html.append(f'<span class="anchor-target" id="file{i}_start"></span>')
-                else:
-                    content_html.append(f'<div>')
-                    content_html.append(f'<span class="anchor-target" id="file{i}_start"></span>')
-
-                # CONTENT INCLUSION
-                # Add processed HTML content
-                if soup.body:
-                    for element in soup.body.children:
-                        if element.name:
-                            content_html.append(str(element))
-                else:
-                    content_html.append(str(soup))
-
-                content_html.append('</div>')
-
-            content_html.append("</body></html>")
-            full_html = '\n'.join(content_html)
-
-            # TEMP HTML CREATION
-            # Write processed content to temporary HTML file
-            self.log_message("Creating temporary HTML file...")
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', encoding='utf-8', delete=False) as temp_file:
-                temp_file.write(full_html)
-                temp_html_path = temp_file.name
-            self.log_message(f"Temporary HTML file created: {temp_html_path}")
-
-            # PDF OUTPUT
-            # Generate PDF from HTML
-            output_path = os.path.join(self.output_dir, f"{title}.pdf")
-            self.log_message(f"Generating PDF at: {output_path}")
-            os.makedirs(self.output_dir, exist_ok=True)
-
-            # PDF CONFIGURATION
-            # Set options for wkhtmltopdf
-            options = {
-                'page-size': 'A4',
-                'margin-top': '0.75in',
-                'margin-right': '0.75in',
-                'margin-bottom': '0.75in',
-                'margin-left': '0.75in',
-                'encoding': "UTF-8",
-                'no-outline': None,
-                'enable-local-file-access': None,
-                'disable-smart-shrinking': None,
-                'image-dpi': 300,
-                'image-quality': 100,
-                'enable-internal-links': None,
-                'print-media-type': None,
-                'zoom': 1.0,
-                'disable-javascript': None,
-                'load-error-handling': 'ignore',
-                'load-media-error-handling': 'ignore'
-            }
-            config = pdfkit.configuration(wkhtmltopdf=self.wkhtmltopdf_path)
+        Args:
+            message_queue: Queue the worker reports progress on.
 
-            self.log_message("Starting PDF conversion...")
+        Returns:
+            int: The number of messages handled.
+        """
+        handled = 0
+        while True:
             try:
-                time.sleep(1)
-                pdfkit.from_file(temp_html_path, output_path, options=options, configuration=config)
-                self.log_message("PDF conversion completed")
-            except Exception as e:
-                self.log_message(f"PDF conversion failed: {str(e)}")
-                raise
-
-            # OUTPUT VERIFICATION
-            # Check if PDF was created successfully
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                self.log_message(f"PDF created successfully! Size: {file_size} bytes")
-            else:
-                raise Exception("PDF file was not created")
-
-            # SUCCESS FEEDBACK
-            # Notify user of successful conversion
-            self.log_message("Conversion completed successfully!")
-            self.status_var.set("Conversion completed")
-            self.root.after(0, lambda: messagebox.showinfo(
-                "Success",
-                f"PDF created successfully!\nSaved as: {output_path}\n\nNote: Chapter breaks and formatting optimized to match EPUB pagination, with improved text flow. Hanging titles may still occur due to wkhtmltopdf limitations."
-            ))
+                kind, text = message_queue.get_nowait()
+            except queue.Empty:
+                return handled
+            handled += 1
+            if kind == "log":
+                self._append_log_text(f"{text}\n")
+            elif kind == "success":
+                # SUCCESS FEEDBACK
+                self.status_var.set("Conversion completed")
+                messagebox.showinfo(
+                    "Success",
+                    f"PDF created successfully!\nSaved as: {text}\n\nNote: Chapter breaks and formatting optimized to match EPUB pagination, with improved text flow. Hanging titles may still occur due to wkhtmltopdf limitations."
+                )
+            elif kind == "error":
+                # ERROR FEEDBACK
+                self.status_var.set("Conversion failed")
+                messagebox.showerror("Error", text)
 
-        except Exception as e:
-            # ERROR HANDLING
-            # Log and display any conversion errors
-            error_msg = f"Error during conversion: {str(e)}"
-            self.log_message(error_msg)
-            self.status_var.set("Conversion failed")
-            self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
+    def finish_conversion(self, temp_root: str) -> None:
+        """
+        Finalize the conversion process by removing its temporary files and resetting the UI.
 
-        finally:
-            # CLEANUP
-            # Remove temporary files and directories
-            time.sleep(2)
-            if temp_html_path and os.path.exists(temp_html_path):
-                try:
-                    os.unlink(temp_html_path)
-                    self.log_message("Cleaned up temporary HTML file")
-                except OSError as e:
-                    self.log_message(f"Error cleaning up temp file: {e}")
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    self.log_message("Cleaned up temporary directory")
-                except OSError as e:
-                    self.log_message(f"Error cleaning up temp directory: {e}")
-            self.root.after(0, self.finish_conversion)
-
-    def finish_conversion(self) -> None:
-        """
-        Finalize the conversion process by resetting the UI.
+        Args:
+            temp_root (str): The temporary directory handed to the worker.
         """
+        # CLEANUP
+        # The worker normally empties this itself; after a timeout it could not
+        shutil.rmtree(temp_root, ignore_errors=True)
+
         # UI RESET
         # Stop progress bar and re-enable convert button
         self.progress.stop()
@@ -713,4 +1185,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for spawned workers in frozen builds
     main()
\ No newline at end of file
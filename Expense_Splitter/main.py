@@ -7,15 +7,79 @@
 # ============================================================================
 
 # Import required libraries
-import locale  # For number and currency formatting based on system locale
+import math  # For exact summation of the entered percentages
+import sys  # For writing the results to the console in one call
+
+# Amounts are formatted with the ':,.2f' format spec, which adds comma thousands
+# separators on its own (PEP 378) without touching the process-wide locale
+
+# Allowed gap between the entered percentages and 100% (floating-point rounding)
+PERCENT_TOLERANCE = 0.01
+
 
 # ============================================================================
-# LOCALE CONFIGURATION
+# INPUT HELPERS
 # ============================================================================
-# Set locale for currency formatting (e.g., for Euro, adjust based on your system)
-# This ensures numbers are displayed with proper thousands separators and decimal points
-# according to the specified locale (US English format provides comma separators)
-locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+def read_percentage(label: str, max_percent: float) -> float:
+    """
+    Prompts until the user enters a percentage between 0 and max_percent.
+
+    Args:
+        label (str): Who the percentage is for (e.g., "Percentage for person 1").
+        max_percent (float): The largest percentage still unassigned.
+
+    Returns:
+        float: The validated percentage.
+    """
+    # PROMPT PREPARATION
+    # Build the prompt and range message once; retries only call input() again
+    # The prompt shows the remaining share so the user knows the upper limit
+    prompt = f"{label} (0-{max_percent:g}): "
+    range_error = f"Percentage must be between 0 and {max_percent:.2f}."
+
+    # SINGLE PERSON PERCENTAGE VALIDATION LOOP
+    while True:
+        try:
+            # PERCENTAGE INPUT
+            percent = float(input(prompt))
+
+            # RANGE VALIDATION
+            # Negative percentages don't make sense for expense splitting
+            # Going over the remaining share would push the total past 100%
+            if percent < 0 or percent > max_percent + PERCENT_TOLERANCE:
+                raise ValueError(range_error)
+            return percent
+
+        except ValueError as e:
+            # INVALID INPUT HANDLING
+            # Handle both conversion errors and range errors
+            print(f"Please enter a valid number. {str(e)}")
+
+
+def read_person_number(number_of_people: int) -> int:
+    """
+    Prompts until the user picks a person by their 1-based number.
+
+    Args:
+        number_of_people (int): The number of people sharing the expenses.
+
+    Returns:
+        int: The chosen person's number (1 to number_of_people).
+    """
+    # PROMPT PREPARATION
+    prompt = f"Which person's percentage should be corrected (1-{number_of_people})? "
+    range_error = f"Person must be between 1 and {number_of_people}."
+
+    # PERSON SELECTION LOOP
+    while True:
+        try:
+            person = int(input(prompt))
+            if person < 1 or person > number_of_people:
+                raise ValueError(range_error)
+            return person
+
+        except ValueError as e:
+            print(f"Please enter a valid number. {str(e)}")
 
 
 # ============================================================================
@@ -44,60 +108,41 @@ def calculate_split(total_amount: float, number_of_people: int, currency: str =
     # PERCENTAGE COLLECTION WITH VALIDATION
     # ========================================================================
 
-    # PERCENTAGE VALIDATION LOOP
-    # Continue collecting percentages until they sum to exactly 100%
-    # This ensures the entire expense amount is accounted for
-    while True:
-        # PERCENTAGE STORAGE
-        percentages = []  # Initialize fresh list for each attempt
-
-        # USER INSTRUCTION
-        print(f"\nEnter the percentage split for each of the {number_of_people} people (total must be 100%):")
-
-        # INDIVIDUAL PERCENTAGE COLLECTION
-        # Get percentage for each person with validation
-        for i in range(number_of_people):
-            # SINGLE PERSON PERCENTAGE VALIDATION LOOP
-            while True:
-                try:
-                    # PERCENTAGE INPUT
-                    # Prompt for percentage with clear numbering (1-based for user friendliness)
-                    percent = float(input(f"Percentage for person {i + 1} (0-100): "))
-
-                    # RANGE VALIDATION
-                    # Ensure percentage is within logical bounds
-                    # Negative percentages don't make sense for expense splitting
-                    # Percentages over 100% would mean paying more than the total
-                    if percent < 0 or percent > 100:
-                        raise ValueError("Percentage must be between 0 and 100.")
-
-                    # VALID PERCENTAGE STORAGE
-                    percentages.append(percent)
-                    break  # Exit inner loop for this person
-
-                except ValueError as e:
-                    # INVALID INPUT HANDLING
-                    # Handle both conversion errors and range errors
-                    print(f"Please enter a valid number. {str(e)}")
-
-        # ====================================================================
-        # TOTAL PERCENTAGE VALIDATION
-        # ====================================================================
-
-        # SUM CALCULATION
-        # Calculate total of all entered percentages
-        total_percent = sum(percentages)
-
-        # FLOATING-POINT TOLERANCE CHECK
-        # Allow small rounding errors (0.01%) due to floating-point arithmetic
-        # This prevents issues when users enter values like 33.33, 33.33, 33.34
-        if abs(total_percent - 100) <= 0.01:
-            break  # Exit percentage collection loop - we have valid data
-        else:
-            # RETRY PROMPT
-            # Clear feedback about why the input was rejected
-            print(f"Error: Percentages sum to {total_percent:.2f}%, must be 100%. Please re-enter splits.")
-            # Loop continues, asking for all percentages again
+    # USER INSTRUCTION
+    print(f"\nEnter the percentage split for each of the {number_of_people} people (total must be 100%):")
+
+    # INDIVIDUAL PERCENTAGE COLLECTION
+    # Track the running total so no entry can push the sum past 100%
+    percentages = []
+    running_total = 0.0
+    for i in range(number_of_people):
+        percent = read_percentage(f"Percentage for person {i + 1}", 100.0 - running_total)
+        percentages.append(percent)
+        running_total += percent
+
+    # ========================================================================
+    # TOTAL PERCENTAGE VALIDATION
+    # ========================================================================
+
+    # SUM CALCULATION
+    # Calculate total of all entered percentages
+    # math.fsum runs in C and rounds only once, so splits like 33.33 + 33.33 + 33.34
+    # don't pick up floating-point drift the way a running sum() can
+    total_percent = math.fsum(percentages)
+
+    # FLOATING-POINT TOLERANCE CHECK
+    # Allow small rounding errors (0.01%) due to floating-point arithmetic
+    # This prevents issues when users enter values like 33.33, 33.33, 33.34
+    while abs(total_percent - 100) > PERCENT_TOLERANCE:
+        # SINGLE ENTRY CORRECTION
+        # Entries can only fall short of 100%, so let the user fix one person
+        # instead of re-entering everybody's percentage
+        print(f"Error: Percentages sum to {total_percent:.2f}%, must be 100%. "
+              f"{100 - total_percent:.2f}% is still unassigned.")
+        index = read_person_number(number_of_people) - 1
+        others_total = total_percent - percentages[index]
+        percentages[index] = read_percentage(f"New percentage for person {index + 1}", 100.0 - others_total)
+        total_percent = math.fsum(percentages)
 
     # ========================================================================
     # AMOUNT CALCULATION
@@ -105,8 +150,10 @@ def calculate_split(total_amount: float, number_of_people: int, currency: str =
 
     # INDIVIDUAL AMOUNT CALCULATION
     # Calculate each person's share using list comprehension
-    # Convert percentage to decimal (divide by 100) and multiply by total
-    amounts = [total_amount * (p / 100) for p in percentages]
+    # The percent-to-decimal factor is folded into one scale computed up front,
+    # so each share is a single multiply
+    scale = total_amount * 0.01
+    amounts = [p * scale for p in percentages]
 
     # ========================================================================
     # FORMATTED RESULTS DISPLAY
@@ -114,8 +161,10 @@ def calculate_split(total_amount: float, number_of_people: int, currency: str =
 
     # SUMMARY HEADER
     # Display the total amount being split
-    print(f"\nTotal expenses: {currency}{total_amount:,.2f}")
-    print(f"Number of people: {number_of_people}")
+    result_lines = [
+        f"\nTotal expenses: {currency}{total_amount:,.2f}",
+        f"Number of people: {number_of_people}",
+    ]
 
     # INDIVIDUAL BREAKDOWN
     # Show each person's percentage and corresponding dollar amount
@@ -124,7 +173,11 @@ def calculate_split(total_amount: float, number_of_people: int, currency: str =
         # DETAILED PERSON BREAKDOWN
         # Show both percentage and calculated amount for transparency
         # :,.2f format adds thousands separators and 2 decimal places
-        print(f"Person {i}: {percent:.2f}% = {currency}{amount:,.2f}")
+        result_lines.append(f"Person {i}: {percent:.2f}% = {currency}{amount:,.2f}")
+
+    # RESULTS OUTPUT
+    # Write the whole breakdown with a single call instead of one print per line
+    sys.stdout.write("\n".join(result_lines) + "\n")
 
 
 # ============================================================================
@@ -7,15 +7,10 @@
 # ============================================================================
 
 # Import required libraries
-import locale  # For number and currency formatting based on system locale
+import sys  # For writing the report to the console in one call
 
-# ============================================================================
-# LOCALE CONFIGURATION
-# ============================================================================
-# Set locale for currency formatting (e.g., for Euro, adjust based on your system)
-# This ensures numbers are displayed with proper thousands separators and decimal points
-# according to the specified locale (US English format in this case)
-locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+# Amounts are formatted with the ':,.2f' format spec, which adds comma thousands
+# separators on its own (PEP 378) without touching the process-wide locale
 
 
 # ============================================================================
@@ -36,30 +31,31 @@ def calculate_finances(monthly_income: float, tax_rate: float, expenses: float,
         None: Prints formatted financial summary to console
     """
 
-    # MONTHLY TAX CALCULATIONS
-    # Calculate how much tax is owed each month
-    # Convert percentage to decimal by dividing by 100, then multiply by income
-    monthly_tax: float = monthly_income * (tax_rate / 100)
+    # NET RATE CALCULATION
+    # Share of income kept after tax; convert the percentage to a decimal once
+    net_rate: float = 1.0 - tax_rate * 0.01
 
     # MONTHLY NET INCOME CALCULATION
     # Determine take-home pay after tax deduction
     # This is the actual amount available to spend each month
-    monthly_net_income: float = monthly_income - monthly_tax
+    monthly_net_income: float = monthly_income * net_rate
+
+    # MONTHLY TAX CALCULATIONS
+    # Calculate how much tax is owed each month (the part of income not kept)
+    monthly_tax: float = monthly_income - monthly_net_income
+
+    # YEARLY NET INCOME CALCULATION
+    # Determine total take-home pay for the year
+    # Assumes 12 months of consistent income
+    yearly_net_income: float = monthly_net_income * 12.0
 
     # YEARLY SALARY CALCULATIONS
     # Calculate total gross income for the entire year
-    # Assumes 12 months of consistent income
-    yearly_salary: float = monthly_income * 12
+    yearly_salary: float = monthly_income * 12.0
 
     # YEARLY TAX CALCULATIONS
     # Calculate total tax burden for the entire year
-    # Simply multiply monthly tax by 12 months
-    yearly_tax: float = monthly_tax * 12
-
-    # YEARLY NET INCOME CALCULATION
-    # Determine total take-home pay for the year
-    # Alternative calculation: yearly_net_income = monthly_net_income * 12
-    yearly_net_income: float = yearly_salary - yearly_tax
+    yearly_tax: float = yearly_salary - yearly_net_income
 
     # AVAILABLE FUNDS CALCULATION
     # Calculate remaining money after essential expenses
@@ -70,40 +66,45 @@ def calculate_finances(monthly_income: float, tax_rate: float, expenses: float,
     # FORMATTED OUTPUT DISPLAY
     # ========================================================================
 
-    # VISUAL SEPARATOR
-    # Create clear visual boundary for the financial report
-    print('____________________________________')
-
-    # INCOME INFORMATION
-    # Display gross monthly income with proper currency formatting
-    # :,.2f format adds thousands separators and 2 decimal places
-    print(f'Monthly Income: {currency}{monthly_income:,.2f}')
-
-    # TAX RATE DISPLAY
-    # Show the tax rate as entered by user with 2 decimal precision
-    print(f'Tax rate: {tax_rate:0.2f}%')
-
-    # MONTHLY TAX AMOUNT
-    # Display calculated monthly tax burden
-    print(f'Monthly Tax: {currency}{monthly_tax:,.2f}')
-
-    # MONTHLY NET INCOME
-    # Show take-home pay after tax deduction
-    print(f'Monthly Net Income: {currency}{monthly_net_income:,.2f}')
-
-    # YEARLY FINANCIAL SUMMARY
-    # Display annual financial figures for long-term planning
-    print(f'Yearly Salary: {currency}{yearly_salary:,.2f}')
-    print(f'Yearly Tax: {currency}{yearly_tax:,.2f}')
-    print(f'Yearly Net Income: {currency}{yearly_net_income:,.2f}')
-
-    # AVAILABLE FUNDS AFTER EXPENSES
-    # Show discretionary income available for savings/entertainment
-    # This can be negative if expenses exceed net income (budget deficit)
-    print(f'Monthly Available Finances After Expenses: {currency}{after_expenses:,.2f}')
-
-    # CLOSING VISUAL SEPARATOR
-    print('____________________________________')
+    # REPORT ASSEMBLY
+    # Build the whole report first and write it with a single call
+    report_lines = [
+        # VISUAL SEPARATOR
+        # Create clear visual boundary for the financial report
+        '____________________________________',
+
+        # INCOME INFORMATION
+        # Display gross monthly income with proper currency formatting
+        # :,.2f format adds thousands separators and 2 decimal places
+        f'Monthly Income: {currency}{monthly_income:,.2f}',
+
+        # TAX RATE DISPLAY
+        # Show the tax rate as entered by user with 2 decimal precision
+        f'Tax rate: {tax_rate:0.2f}%',
+
+        # MONTHLY TAX AMOUNT
+        # Display calculated monthly tax burden
+        f'Monthly Tax: {currency}{monthly_tax:,.2f}',
+
+        # MONTHLY NET INCOME
+        # Show take-home pay after tax deduction
+        f'Monthly Net Income: {currency}{monthly_net_income:,.2f}',
+
+        # YEARLY FINANCIAL SUMMARY
+        # Display annual financial figures for long-term planning
+        f'Yearly Salary: {currency}{yearly_salary:,.2f}',
+        f'Yearly Tax: {currency}{yearly_tax:,.2f}',
+        f'Yearly Net Income: {currency}{yearly_net_income:,.2f}',
+
+        # AVAILABLE FUNDS AFTER EXPENSES
+        # Show discretionary income available for savings/entertainment
+        # This can be negative if expenses exceed net income (budget deficit)
+        f'Monthly Available Finances After Expenses: {currency}{after_expenses:,.2f}',
+
+        # CLOSING VISUAL SEPARATOR
+        '____________________________________',
+    ]
+    sys.stdout.write('\n'.join(report_lines) + '\n')
 
 
 # ============================================================================
@@ -22,14 +22,27 @@
 import ttkbootstrap as ttk
 from PIL import Image, ImageTk
 import random
-import pandas as pd
+import csv
 import os
 import json
+import pickle
+import hashlib
 import tkinter.messagebox as messagebox
 import tkinter.filedialog as filedialog
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson  # Optional: faster progress saves
+except ImportError:
+    orjson = None
 
 BACKGROUND_COLOR = "#B1DDC6"
+CARD_SIZE = (800, 526)  # Canvas size the card images are drawn at
+FLIP_DELAY_MS = 5000  # Time a card's front is shown before it flips
+MILESTONE_STEP = 20  # Encourage the user every this many learned words
+REVIEW_SOURCES = {"unfamiliar": "words_to_learn", "familiar": "words_learned"}  # Progress set each review mode draws from
+SAVE_DELAY_MS = 2000  # Progress is written this long after the last answer
+CSV_CACHE_VERSION = 2  # Bump when the pickled column format changes
 
 
 class FlashCardUI:
@@ -40,24 +53,29 @@ class FlashCardUI:
         self.window.title("Flash Cards")
         self.window.geometry("900x800")
         self.window.minsize(800, 600)
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Pending progress saves, written together after SAVE_DELAY_MS
+        self.dirty_lang_pairs = set()
+        self.save_after_id = None
+
+        # Parsed CSV columns shared by every language switch: {csv_path: (signature, columns)}
+        self.csv_cache = {}
 
         # Initialize language data
-        self.languages = {}  # {lang_pair: {"front": str, "back": str, "csv_path": str, "data": list, "words_to_learn": list, "words_learned": list, "learned_count": int, ...}}
+        self.languages = {}  # {lang_pair: {"front": str, "back": str, "csv_path": str, "front_col": list, "back_col": list, "words_to_learn": dict, "words_learned": dict, "learned_count": int, ...}}
         self.current_lang_pair = "Slovenian-English"
         self.languages[self.current_lang_pair] = {
             "front": "Slovenian",
             "back": "English",
             "csv_path": "./data/slovenian_words.csv",
-            "data": [],
-            "words_to_learn": [],
-            "words_learned": [],
+            "front_col": [],  # Words as parallel columns, indexed by CSV row
+            "back_col": [],
+            "words_to_learn": {},  # {row: None}, an insertion-ordered set of row ids
+            "words_learned": {},
             "learned_count": 0,
-            "recent_words_new": deque(maxlen=5),
-            "recent_words_unfamiliar": deque(maxlen=5),
-            "recent_words_learned": deque(maxlen=5),
-            "current_word_index_new": 0,
-            "current_word_index_unfamiliar": 0,
-            "current_word_index_learned": 0
+            "next_milestone": MILESTONE_STEP,
+            "mode_state": self.new_mode_state()
         }
         self.load_language_configs()
         self.load_dictionaries()
@@ -66,9 +84,57 @@ class FlashCardUI:
         self.display_order = self.languages[self.current_lang_pair]["front"]
         self.learning_mode = "new"
 
-        # Load card images
-        self.card_front = ImageTk.PhotoImage(Image.open("./images/card_front.png"))
-        self.card_back = ImageTk.PhotoImage(Image.open("./images/card_back.png"))
+        # Load card images at display size
+        def load_card_image(path):
+            """Return the card image scaled to CARD_SIZE, without an alpha channel if it is fully opaque."""
+            img = Image.open(path)
+            img.load()
+            if img.size != CARD_SIZE:
+                img = img.resize(CARD_SIZE, Image.LANCZOS)
+            if img.mode == 'RGBA' and img.getextrema()[3] == (255, 255):
+                img = img.convert('RGB')  # The transparent corners of the bundled cards keep RGBA
+            return img
+
+        # Load and process button images (processed copies are cached on disk)
+        crop_pixels = 5
+        def clean_button_image(img):
+            width, height = img.size
+            crop_box = (crop_pixels, crop_pixels, width - crop_pixels, height - crop_pixels)
+            cropped_img = img.crop(crop_box)
+            if cropped_img.mode != 'RGBA':
+                cropped_img = cropped_img.convert('RGBA')
+            from PIL import ImageFilter
+            smoothed = cropped_img.filter(ImageFilter.SMOOTH_MORE)
+            return smoothed
+
+        def load_button_image(path):
+            """Return the cleaned button image, reusing the copy cached in images/.cache if present."""
+            with open(path, "rb") as f:
+                digest = hashlib.blake2b(f.read() + f":{crop_pixels}".encode(), digest_size=8).hexdigest()
+            cache_path = os.path.join("images", ".cache", f"{digest}.png")
+            if os.path.exists(cache_path):
+                img = Image.open(cache_path)
+                img.load()
+                return img
+            processed = clean_button_image(Image.open(path))
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                processed.save(cache_path)
+            except OSError as e:
+                print(f"Error caching button image {path}: {e}")
+            return processed
+
+        # Decode all four images at once (Pillow releases the GIL while decoding);
+        # Tk only allows the PhotoImages themselves to be created on this thread
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            card_front = pool.submit(load_card_image, "./images/card_front.png")
+            card_back = pool.submit(load_card_image, "./images/card_back.png")
+            right_img_processed = pool.submit(load_button_image, "images/right.png")
+            wrong_img_processed = pool.submit(load_button_image, "images/wrong.png")
+        self.card_front = ImageTk.PhotoImage(card_front.result())
+        self.card_back = ImageTk.PhotoImage(card_back.result())
+        self.right_image = ImageTk.PhotoImage(right_img_processed.result())
+        self.wrong_image = ImageTk.PhotoImage(wrong_img_processed.result())
 
         # Create main frame
         self.main_frame = ttk.Frame(self.window)
@@ -130,34 +196,18 @@ class FlashCardUI:
         self.title_text_id = self.canvas.create_text(400, 150, text=self.languages[self.current_lang_pair]["front"], font=("Arial", 40, "italic"), fill="black")
         self.word_text_id = self.canvas.create_text(400, 280, text="", font=("Arial", 60, "bold"), fill="black")
 
+        # Pending flip timer and canvas redraw, so each is scheduled at most once
+        self.flip_timer = None
+        self.redraw_after_id = None
+
         # Display initial random word
-        self.current_word = self.get_random_word()
+        self.current_index = self.get_random_word()
         self.update_card()
 
         # Create button frame
         self.btn_frame = ttk.Frame(self.main_frame)
         self.btn_frame.pack(fill="x", pady=10)
 
-        # Load and process button images
-        right_img = Image.open("images/right.png")
-        wrong_img = Image.open("images/wrong.png")
-
-        crop_pixels = 5
-        def clean_button_image(img):
-            width, height = img.size
-            crop_box = (crop_pixels, crop_pixels, width - crop_pixels, height - crop_pixels)
-            cropped_img = img.crop(crop_box)
-            if cropped_img.mode != 'RGBA':
-                cropped_img = cropped_img.convert('RGBA')
-            from PIL import ImageFilter
-            smoothed = cropped_img.filter(ImageFilter.SMOOTH_MORE)
-            return smoothed
-
-        right_img_processed = clean_button_image(right_img)
-        wrong_img_processed = clean_button_image(wrong_img)
-        self.right_image = ImageTk.PhotoImage(right_img_processed)
-        self.wrong_image = ImageTk.PhotoImage(wrong_img_processed)
-
         # Configure button style
         style = ttk.Style()
         style.configure(
@@ -189,16 +239,13 @@ class FlashCardUI:
                         "front": config["front"],
                         "back": config["back"],
                         "csv_path": config["csv_path"],
-                        "data": [],
-                        "words_to_learn": [],
-                        "words_learned": [],
+                        "front_col": [],  # Words as parallel columns, indexed by CSV row
+                        "back_col": [],
+                        "words_to_learn": {},  # {row: None}, an insertion-ordered set of row ids
+                        "words_learned": {},
                         "learned_count": 0,
-                        "recent_words_new": deque(maxlen=5),
-                        "recent_words_unfamiliar": deque(maxlen=5),
-                        "recent_words_learned": deque(maxlen=5),
-                        "current_word_index_new": 0,
-                        "current_word_index_unfamiliar": 0,
-                        "current_word_index_learned": 0
+                        "next_milestone": MILESTONE_STEP,
+                        "mode_state": self.new_mode_state()
                     }
         except (FileNotFoundError, json.JSONDecodeError):
             # Initialize with default if no config file exists
@@ -253,38 +300,29 @@ class FlashCardUI:
                 return
 
             try:
-                data = pd.read_csv(file_path, encoding='utf-8')
-                if len(data.columns) != 2:
-                    raise ValueError("CSV must have exactly two columns.")
+                front_col, back_col = self.read_csv_columns(file_path)
                 
                 lang_pair = f"{front_lang}-{back_lang}"
                 if lang_pair in self.languages:
                     messagebox.showwarning("Warning", f"Language pair {lang_pair} already exists. Overwriting with new CSV.")
                 
-                data.columns = [front_lang, back_lang]
                 self.languages[lang_pair] = {
                     "front": front_lang,
                     "back": back_lang,
                     "csv_path": file_path,
-                    "data": data.to_dict(orient="records"),
-                    "words_to_learn": [],
-                    "words_learned": [],
+                    "front_col": front_col,  # Words as parallel columns, indexed by CSV row
+                    "back_col": back_col,
+                    "words_to_learn": {},  # {row: None}, an insertion-ordered set of row ids
+                    "words_learned": {},
                     "learned_count": 0,
-                    "recent_words_new": deque(maxlen=5),
-                    "recent_words_unfamiliar": deque(maxlen=5),
-                    "recent_words_learned": deque(maxlen=5),
-                    "current_word_index_new": 0,
-                    "current_word_index_unfamiliar": 0,
-                    "current_word_index_learned": 0
+                    "next_milestone": MILESTONE_STEP,
+                    "mode_state": self.new_mode_state()
                 }
                 self.save_dictionaries(lang_pair)
                 self.save_language_configs()
 
-                # Update language dropdown
-                self.lang_menu['menu'].delete(0, 'end')
-                for lp in self.languages.keys():
-                    self.lang_menu['menu'].add_command(label=lp, command=lambda x=lp: self.lang_var.set(x))
-                self.lang_var.set(lang_pair)
+                # Rebuild the language dropdown in one pass and select the new pair
+                self.lang_menu.set_menu(lang_pair, *self.languages)
                 self.update_language()
 
                 messagebox.showinfo("Success", f"Loaded new language: {lang_pair}")
@@ -299,11 +337,17 @@ class FlashCardUI:
         """Load or initialize words_to_learn and words_learned dictionaries for the current language."""
         lang_data = self.languages[self.current_lang_pair]
         try:
-            data = pd.read_csv(lang_data["csv_path"], encoding='utf-8')
-            if len(data.columns) != 2:
-                raise ValueError("CSV must have exactly two columns.")
-            data.columns = [lang_data["front"], lang_data["back"]]
-            lang_data["data"] = data.to_dict(orient="records")
+            signature = self.csv_cache_signature(lang_data)
+            cached = self.csv_cache.get(lang_data["csv_path"])
+            if cached is not None and cached[0] == signature:
+                columns = cached[1]  # Unchanged since the last visit to this language
+            else:
+                columns = self.load_cached_columns(signature)
+                if columns is None:
+                    columns = self.read_csv_columns(lang_data["csv_path"])
+                    self.save_cached_columns(signature, columns)
+                self.csv_cache[lang_data["csv_path"]] = (signature, columns)
+            lang_data["front_col"], lang_data["back_col"] = columns
 
             try:
                 with open(f"./data/{self.current_lang_pair}_words_to_learn.json", "r", encoding='utf-8') as f:
@@ -317,99 +361,274 @@ class FlashCardUI:
             except (FileNotFoundError, json.JSONDecodeError):
                 lang_data["words_learned"] = []
 
-            lang_data["words_to_learn"] = [word for word in lang_data["words_to_learn"] if word in lang_data["data"]]
-            lang_data["words_learned"] = [word for word in lang_data["words_learned"] if word in lang_data["data"]]
+            self.build_word_index(lang_data)
+            lang_data["words_to_learn"] = self.saved_progress_rows(lang_data, lang_data["words_to_learn"])
+            lang_data["words_learned"] = self.saved_progress_rows(lang_data, lang_data["words_learned"])
+            lang_data["new_rows_left"] = len(lang_data["front_col"]) - len(lang_data["words_to_learn"].keys() | lang_data["words_learned"].keys())
 
         except FileNotFoundError:
             print(f"Error: CSV not found at {lang_data['csv_path']} for {self.current_lang_pair}.")
-            lang_data["data"] = []
-            lang_data["words_to_learn"] = []
-            lang_data["words_learned"] = []
+            lang_data["front_col"] = []
+            lang_data["back_col"] = []
+            lang_data["words_to_learn"] = {}
+            lang_data["words_learned"] = {}
+            self.build_word_index(lang_data)
         except ValueError as e:
             print(f"Error loading CSV: {e}")
-            lang_data["data"] = []
-            lang_data["words_to_learn"] = []
-            lang_data["words_learned"] = []
+            lang_data["front_col"] = []
+            lang_data["back_col"] = []
+            lang_data["words_to_learn"] = {}
+            lang_data["words_learned"] = {}
+            self.build_word_index(lang_data)
+
+    def word_key(self, word):
+        """Return the hashable (front, back) key identifying a word dictionary from an old progress file."""
+        lang_data = self.languages[self.current_lang_pair]
+        return (word.get(lang_data["front"]), word.get(lang_data["back"]))
+
+    def saved_progress_rows(self, lang_data, saved):
+        """Return saved progress as an insertion-ordered set of row ids, migrating old word dictionaries."""
+        row_count = len(lang_data["front_col"])
+        row_by_key = None
+        rows = {}  # Dicts keep the saved order and give O(1) membership, insertion, and removal
+        for entry in saved:
+            if isinstance(entry, int):
+                if 0 <= entry < row_count:
+                    rows[entry] = None
+            elif isinstance(entry, dict):
+                # Older progress files store whole words; match them to rows by (front, back)
+                if row_by_key is None:
+                    row_by_key = dict(zip(zip(lang_data["front_col"], lang_data["back_col"]), range(row_count)))
+                row = row_by_key.get(self.word_key(entry))
+                if row is not None:
+                    rows[row] = None
+        return rows
+
+    def build_word_index(self, lang_data):
+        """Build the per-row "new" mode state for the loaded words."""
+        lang_data["new_rows_left"] = len(lang_data["front_col"])  # Rows never answered right or wrong
+        # Shuffled row ids for "new" mode, consumed by a cursor and reshuffled when exhausted
+        lang_data["shuffle_order"] = list(range(len(lang_data["front_col"])))
+        random.shuffle(lang_data["shuffle_order"])
+        lang_data["shuffle_cursor"] = 0
+        # Unanswered row ids cycled through once 50 or fewer are left, built on first use
+        lang_data["available_ring"] = None
+        lang_data["ring_slots"] = None  # {row: position in available_ring}
+        # Review-mode row ids per progress set, kept in step with the set and built on first use
+        lang_data["review_rows"] = {source: None for source in REVIEW_SOURCES.values()}
+        lang_data["review_slots"] = {source: None for source in REVIEW_SOURCES.values()}  # {row: position}
+
+    def next_new_word(self, lang_data):
+        """Return a random unanswered, not recently shown row in O(1) amortized time."""
+        to_learn, learned = lang_data["words_to_learn"], lang_data["words_learned"]
+        order, recent_rows = lang_data["shuffle_order"], lang_data["mode_state"]["new"]["recent"]
+        while True:
+            cursor = lang_data["shuffle_cursor"]
+            if cursor >= len(order):
+                random.shuffle(order)
+                cursor = lang_data["shuffle_cursor"] = 0
+            row = order[cursor]
+            if row in to_learn or row in learned:
+                # Answered words never become new again, so drop them from the order for good
+                order[cursor] = order[-1]
+                order.pop()
+                continue
+            lang_data["shuffle_cursor"] = cursor + 1
+            if row not in recent_rows:
+                recent_rows.append(row)
+                return row
+
+    def available_ring(self, lang_data):
+        """Return the unanswered row ids, building the ring from the progress sets the first time."""
+        if lang_data["available_ring"] is None:
+            to_learn, learned = lang_data["words_to_learn"], lang_data["words_learned"]
+            ring = [row for row in range(len(lang_data["front_col"])) if row not in to_learn and row not in learned]
+            lang_data["available_ring"] = ring
+            lang_data["ring_slots"] = {row: slot for slot, row in enumerate(ring)}
+        return lang_data["available_ring"]
+
+    def count_answer(self, lang_data, row):
+        """Retire a row from "new" mode before it is first marked right or wrong."""
+        if row not in lang_data["words_to_learn"] and row not in lang_data["words_learned"]:
+            lang_data["new_rows_left"] -= 1
+            ring, ring_slots = lang_data["available_ring"], lang_data["ring_slots"]
+            if ring is not None:
+                self.swap_remove(ring, ring_slots, row)
+
+    def swap_remove(self, rows, slots, row):
+        """Remove a row from a row list by swapping the last row into its slot, keeping removal O(1)."""
+        slot = slots.pop(row)
+        last_row = rows.pop()
+        if last_row != row:
+            rows[slot] = last_row
+            slots[last_row] = slot
+
+    def review_rows(self, lang_data, source):
+        """Return the row ids of a progress set as a list to pick from, building it the first time."""
+        rows = lang_data["review_rows"][source]
+        if rows is None:
+            rows = lang_data["review_rows"][source] = list(lang_data[source])
+            lang_data["review_slots"][source] = {row: slot for slot, row in enumerate(rows)}
+        return rows
+
+    def add_progress_row(self, lang_data, source, row):
+        """Add a row to a progress set and its review list; return False if it was already there."""
+        if row in lang_data[source]:
+            return False
+        lang_data[source][row] = None
+        rows = lang_data["review_rows"][source]
+        if rows is not None:
+            lang_data["review_slots"][source][row] = len(rows)
+            rows.append(row)
+        return True
+
+    def remove_progress_row(self, lang_data, source, row):
+        """Remove a row from a progress set and its review list, if present."""
+        if row in lang_data[source]:
+            del lang_data[source][row]
+            if lang_data["review_rows"][source] is not None:
+                self.swap_remove(lang_data["review_rows"][source], lang_data["review_slots"][source], row)
+
+    def read_csv_columns(self, csv_path):
+        """Read a two-column vocabulary CSV into (front_col, back_col), skipping the header row."""
+        with open(csv_path, "r", encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            if len(next(reader, [])) != 2:
+                raise ValueError("CSV must have exactly two columns.")
+            rows = [row for row in reader if len(row) == 2]  # Blank or malformed lines are skipped
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def csv_cache_signature(self, lang_data):
+        """Return what identifies a parsed CSV: its path, modification time, size, and column names."""
+        stat = os.stat(lang_data["csv_path"])
+        return (CSV_CACHE_VERSION, os.path.abspath(lang_data["csv_path"]), stat.st_mtime_ns, stat.st_size, lang_data["front"], lang_data["back"])
+
+    def load_cached_columns(self, signature):
+        """Return the pickled (front_col, back_col) for the current language, or None if missing or stale."""
+        try:
+            with open(f"./data/{self.current_lang_pair}_words.pkl", "rb") as f:
+                cached = pickle.load(f)
+            if cached["signature"] == signature:
+                return cached["columns"]
+        except Exception:
+            # Missing, unreadable, or outdated cache; fall back to parsing the CSV
+            pass
+        return None
+
+    def save_cached_columns(self, signature, columns):
+        """Pickle parsed CSV columns so later launches can skip CSV parsing."""
+        cache_path = f"./data/{self.current_lang_pair}_words.pkl"
+        try:
+            os.makedirs("./data", exist_ok=True)
+            with open(cache_path + ".tmp", "wb") as f:
+                pickle.dump({"signature": signature, "columns": columns}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_path + ".tmp", cache_path)  # Never leave a half-written cache behind
+        except Exception as e:
+            print(f"Error caching CSV for {self.current_lang_pair}: {e}")
 
     def save_dictionaries(self, lang_pair):
         """Save words_to_learn and words_learned to JSON files for the given language pair."""
         try:
             os.makedirs("./data", exist_ok=True)
             lang_data = self.languages[lang_pair]
-            with open(f"./data/{lang_pair}_words_to_learn.json", "w", encoding='utf-8') as f:
-                json.dump(lang_data["words_to_learn"], f, ensure_ascii=False, indent=2)
-            with open(f"./data/{lang_pair}_words_learned.json", "w", encoding='utf-8') as f:
-                json.dump(lang_data["words_learned"], f, ensure_ascii=False, indent=2)
+            for name in ("words_to_learn", "words_learned"):
+                path = f"./data/{lang_pair}_{name}.json"
+                rows = list(lang_data[name])  # CSV row ids
+                if orjson is not None:
+                    payload = orjson.dumps(rows)
+                else:
+                    payload = json.dumps(rows, separators=(",", ":")).encode('utf-8')
+                with open(path + ".tmp", "wb") as f:
+                    f.write(payload)
+                os.replace(path + ".tmp", path)  # A crash mid-write never corrupts saved progress
         except Exception as e:
             print(f"Error saving dictionaries for {lang_pair}: {e}")
 
+    def schedule_save(self, lang_pair):
+        """Mark a language pair's progress as changed and save it once answers pause."""
+        self.dirty_lang_pairs.add(lang_pair)
+        if self.save_after_id is not None:
+            self.window.after_cancel(self.save_after_id)
+        self.save_after_id = self.window.after(SAVE_DELAY_MS, self.flush_saves)
+
+    def flush_saves(self):
+        """Write all pending progress saves now."""
+        if self.save_after_id is not None:
+            self.window.after_cancel(self.save_after_id)
+            self.save_after_id = None
+        for lang_pair in self.dirty_lang_pairs:
+            self.save_dictionaries(lang_pair)
+        self.dirty_lang_pairs.clear()
+
+    def on_close(self):
+        """Save pending progress before closing the window."""
+        self.flush_saves()
+        self.window.destroy()
+
     def update_language(self, *args):
         """Update the current language pair and refresh the UI."""
+        self.flush_saves()  # The reload below reads progress back from disk
         self.current_lang_pair = self.lang_var.get()
         self.load_dictionaries()  # Reload CSV and JSON for the selected language
         lang_data = self.languages[self.current_lang_pair]
         self.display_order = lang_data["front"]
-        self.order_var.set(lang_data["front"])
-        self.order_menu['menu'].delete(0, 'end')
-        self.order_menu['menu'].add_command(label=lang_data["front"], command=lambda: self.order_var.set(lang_data["front"]))
-        self.order_menu['menu'].add_command(label=lang_data["back"], command=lambda: self.order_var.set(lang_data["back"]))
+        self.order_menu.set_menu(lang_data["front"], lang_data["front"], lang_data["back"])
         self.mode_var.set("Learn New Words")
         self.learning_mode = "new"
         self.current_side = "front"
-        self.window.after_cancel(self.flip_timer)
-        self.current_word = self.get_random_word()
+        self.cancel_flip()
+        self.current_index = self.get_random_word()
         self.update_card()
 
+    def new_mode_state(self):
+        """Return fresh picking state for each learning mode: recently shown rows and the cycling position."""
+        return {mode: {"recent": deque(maxlen=5), "idx": 0} for mode in ("new", "unfamiliar", "familiar")}
+
     def get_random_word(self):
-        """Return a word dictionary based on learning mode and spaced repetition."""
+        """Return the row id of the next word based on learning mode and spaced repetition, or None if there is none."""
         lang_data = self.languages[self.current_lang_pair]
+        state = lang_data["mode_state"][self.learning_mode]
         if self.learning_mode == "new":
-            available_words = [word for word in lang_data["data"] if word not in lang_data["words_to_learn"] and word not in lang_data["words_learned"]]
-            if not available_words:
-                available_words = lang_data["data"]
-            if len(available_words) <= 50:
-                word = available_words[lang_data["current_word_index_new"] % len(available_words)]
-                lang_data["current_word_index_new"] += 1
-                return word
+            if lang_data["new_rows_left"] > 50:
+                return self.next_new_word(lang_data)
+            row_count = len(lang_data["front_col"])
+            if not row_count:
+                return None
+            available_rows = self.available_ring(lang_data) if lang_data["new_rows_left"] else range(row_count)
+            if len(available_rows) <= 50:
+                row = available_rows[state["idx"] % len(available_rows)]
+                state["idx"] += 1
+                return row
             else:
-                available_words = [word for word in available_words if word not in lang_data["recent_words_new"]]
-                if not available_words:
-                    lang_data["recent_words_new"].clear()
-                    available_words = [word for word in lang_data["data"] if word not in lang_data["words_to_learn"] and word not in lang_data["words_learned"]]
-                    if not available_words:
-                        available_words = lang_data["data"]
-                word = random.choice(available_words)
-                lang_data["recent_words_new"].append(word)
-                return word
+                # Every word has been answered, so pick from all of them; with more
+                # than 50 rows and only 5 recent ones, a retry is rarely needed
+                row = random.randrange(row_count)
+                while row in state["recent"]:
+                    row = random.randrange(row_count)
+                state["recent"].append(row)
+                return row
         
-        word_list = lang_data["words_to_learn"] if self.learning_mode == "unfamiliar" else lang_data["words_learned"]
-        recent_words = lang_data["recent_words_unfamiliar"] if self.learning_mode == "unfamiliar" else lang_data["recent_words_learned"]
-        current_index = lang_data["current_word_index_unfamiliar"] if self.learning_mode == "unfamiliar" else lang_data["current_word_index_learned"]
-
-        if not word_list:
-            return {lang_data["front"]: "", lang_data["back"]: ""}
-
-        if len(word_list) <= 50:
-            word = word_list[current_index]
-            if self.learning_mode == "unfamiliar":
-                lang_data["current_word_index_unfamiliar"] = (current_index + 1) % len(word_list)
-            else:
-                lang_data["current_word_index_learned"] = (current_index + 1) % len(word_list)
-            return word
+        row_list = self.review_rows(lang_data, REVIEW_SOURCES[self.learning_mode])
+        if not row_list:
+            return None
+
+        if len(row_list) <= 50:
+            index = state["idx"] % len(row_list)  # The list may have shrunk since the last pick
+            state["idx"] = index + 1
+            return row_list[index]
         else:
-            available_words = [word for word in word_list if word not in recent_words]
-            if not available_words:
-                recent_words.clear()
-                available_words = word_list
-            word = random.choice(available_words)
-            recent_words.append(word)
-            return word
+            # More than 50 rows and at most 5 recent ones: retrying is cheaper than filtering
+            row = random.choice(row_list)
+            while row in state["recent"]:
+                row = random.choice(row_list)
+            state["recent"].append(row)
+            return row
 
     def update_display_order(self, *args):
         """Update the display order based on user selection and refresh card."""
         self.display_order = self.order_var.get()
         self.current_side = "front"
-        self.window.after_cancel(self.flip_timer)
+        self.cancel_flip()
         self.update_card()
 
     def update_learning_mode(self, *args):
@@ -436,33 +655,54 @@ class FlashCardUI:
                 "Repeat Unfamiliar Words": "unfamiliar",
                 "Repeat Familiar Words": "familiar"
             }[selected_mode]
-            lang_data["current_word_index_new"] = 0
-            lang_data["current_word_index_unfamiliar"] = 0
-            lang_data["current_word_index_learned"] = 0
-            lang_data["recent_words_new"].clear()
-            lang_data["recent_words_unfamiliar"].clear()
-            lang_data["recent_words_learned"].clear()
+            lang_data["mode_state"] = self.new_mode_state()
         self.current_side = "front"
-        self.window.after_cancel(self.flip_timer)
-        self.current_word = self.get_random_word()
+        self.cancel_flip()
+        self.current_index = self.get_random_word()
         self.update_card()
 
     def update_card(self):
+        """Redraw the card once the current event is handled, merging back-to-back updates."""
+        if self.redraw_after_id is None:
+            self.redraw_after_id = self.window.after_idle(self.redraw)
+
+    def redraw(self):
         """Update the canvas to display the current word."""
+        self.redraw_after_id = None
         lang_data = self.languages[self.current_lang_pair]
         if self.current_side == "front":
             self.canvas.itemconfig(self.card_image_id, image=self.card_front)
             self.canvas.itemconfig(self.title_text_id, text=self.display_order, fill="black")
-            self.canvas.itemconfig(self.word_text_id, text=self.current_word[self.display_order], fill="black")
-            self.flip_timer = self.window.after(5000, self.flip_to_back)
+            self.canvas.itemconfig(self.word_text_id, text=self.word_text(self.display_order), fill="black")
+            self.schedule_flip()
         else:
             back_language = lang_data["back"] if self.display_order == lang_data["front"] else lang_data["front"]
             self.canvas.itemconfig(self.card_image_id, image=self.card_back)
             self.canvas.itemconfig(self.title_text_id, text=back_language, fill="white")
-            self.canvas.itemconfig(self.word_text_id, text=self.current_word[back_language], fill="white")
+            self.canvas.itemconfig(self.word_text_id, text=self.word_text(back_language), fill="white")
+
+    def word_text(self, language):
+        """Return the current word in the given language, or an empty string if there is none."""
+        if self.current_index is None:
+            return ""
+        lang_data = self.languages[self.current_lang_pair]
+        column = lang_data["front_col"] if language == lang_data["front"] else lang_data["back_col"]
+        return column[self.current_index]
+
+    def schedule_flip(self):
+        """Restart the countdown to flipping the card, replacing any pending one."""
+        self.cancel_flip()
+        self.flip_timer = self.window.after(FLIP_DELAY_MS, self.flip_to_back)
+
+    def cancel_flip(self):
+        """Cancel the pending card flip, if any."""
+        if self.flip_timer is not None:
+            self.window.after_cancel(self.flip_timer)
+            self.flip_timer = None
 
     def flip_to_back(self):
         """Flip the card to show the opposite language."""
+        self.flip_timer = None
         self.current_side = "back"
         self.update_card()
 
@@ -514,37 +754,42 @@ class FlashCardUI:
         print("Right button clicked")
         lang_data = self.languages[self.current_lang_pair]
         if self.current_side == "front":
-            self.window.after_cancel(self.flip_timer)
+            self.cancel_flip()
             self.flip_to_back()
         else:
-            if self.current_word not in lang_data["words_learned"]:
-                lang_data["words_learned"].append(self.current_word)
-                lang_data["learned_count"] += 1
-                if lang_data["learned_count"] % 20 == 0:
-                    messagebox.showinfo(
-                        "Great Progress!",
-                        f"You've learned {lang_data['learned_count']} words! Consider switching to 'Repeat Familiar Words' to review them."
-                    )
-            if self.current_word in lang_data["words_to_learn"]:
-                lang_data["words_to_learn"].remove(self.current_word)
-            self.save_dictionaries(self.current_lang_pair)
-            self.current_word = self.get_random_word()
+            row = self.current_index
+            milestone_message = None
+            if row is not None:
+                self.count_answer(lang_data, row)
+                if self.add_progress_row(lang_data, "words_learned", row):
+                    lang_data["learned_count"] += 1
+                    if lang_data["learned_count"] == lang_data["next_milestone"]:
+                        lang_data["next_milestone"] += MILESTONE_STEP
+                        milestone_message = f"You've learned {lang_data['learned_count']} words! Consider switching to 'Repeat Familiar Words' to review them."
+                self.remove_progress_row(lang_data, "words_to_learn", row)
+                self.schedule_save(self.current_lang_pair)
+            self.current_index = self.get_random_word()
             self.current_side = "front"
             self.update_card()
+            if milestone_message:
+                # Queued behind the redraw so the next card is shown before the popup
+                self.window.after_idle(lambda: messagebox.showinfo("Great Progress!", milestone_message))
 
     def wrong(self):
         print("Wrong button clicked")
         lang_data = self.languages[self.current_lang_pair]
         if self.current_side == "front":
-            self.window.after_cancel(self.flip_timer)
+            self.cancel_flip()
             self.flip_to_back()
         else:
-            if self.current_word not in lang_data["words_to_learn"]:
-                lang_data["words_to_learn"].append(self.current_word)
-            if self.learning_mode == "familiar" and self.current_word in lang_data["words_learned"]:
-                lang_data["words_learned"].remove(self.current_word)
-            self.save_dictionaries(self.current_lang_pair)
-            self.current_word = self.get_random_word()
+            row = self.current_index
+            if row is not None:
+                self.count_answer(lang_data, row)
+                self.add_progress_row(lang_data, "words_to_learn", row)
+                if self.learning_mode == "familiar":
+                    self.remove_progress_row(lang_data, "words_learned", row)
+                self.schedule_save(self.current_lang_pair)
+            self.current_index = self.get_random_word()
             self.current_side = "front"
             self.update_card()
 
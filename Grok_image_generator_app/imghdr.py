@@ -14,6 +14,30 @@ Minimal imghdr module replacement for Python 3.13 compatibility
 Place this file in the same directory as your main.py
 """
 
+import os
+import re
+
+# Magic-byte prefixes of the fixed-signature formats
+_SIGNATURES = {
+    b'\xff\xd8\xff': 'jpeg',
+    b'\x89PNG\r\n\x1a\n': 'png',
+    b'GIF87a': 'gif',
+    b'GIF89a': 'gif',
+    b'BM': 'bmp',
+    b'\x00\x00\x01\x00': 'ico',
+    b'\x00\x00\x02\x00': 'ico',
+    b'II\x2a\x00': 'tiff',
+    b'MM\x00\x2a': 'tiff',
+}
+
+# All signatures as one anchored alternation, one capture group per format, so a
+# single match() classifies the header; WEBP's marker follows a 4-byte size field
+_SIGNATURE_NAMES = [None, *_SIGNATURES.values(), 'webp']  # Indexed by group number
+_SIGNATURE_RE = re.compile(
+    b'|'.join(b'(' + re.escape(prefix) + b')' for prefix in _SIGNATURES) + b'|(RIFF.{0,4}WEBP)',
+    re.DOTALL
+)
+
 
 def what(file, h=None):
     """
@@ -28,27 +52,16 @@ def what(file, h=None):
             if hasattr(file, 'seek'):
                 file.seek(current_pos)  # Reset file pointer
         else:
-            # File path string
-            with open(file, 'rb') as f:
-                header = f.read(32)
+            # File path string: one unbuffered read(2), no BufferedReader for 32 bytes
+            fd = os.open(file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                header = os.read(fd, 32)
+            finally:
+                os.close(fd)
 
         # Detect common image formats by magic bytes
-        if header.startswith(b'\xff\xd8\xff'):
-            return 'jpeg'
-        elif header.startswith(b'\x89PNG\r\n\x1a\n'):
-            return 'png'
-        elif header.startswith(b'GIF87a') or header.startswith(b'GIF89a'):
-            return 'gif'
-        elif header.startswith(b'RIFF') and b'WEBP' in header[:12]:
-            return 'webp'
-        elif header.startswith(b'BM'):
-            return 'bmp'
-        elif header.startswith(b'\x00\x00\x01\x00') or header.startswith(b'\x00\x00\x02\x00'):
-            return 'ico'
-        elif header.startswith(b'II\x2a\x00') or header.startswith(b'MM\x00\x2a'):
-            return 'tiff'
-
-        return None
+        match = _SIGNATURE_RE.match(header)
+        return _SIGNATURE_NAMES[match.lastindex] if match else None
 
     except (IOError, OSError, AttributeError):
         return None
@@ -5,7 +5,7 @@
 # ║  - Prompt-based image generation with quick prompts                       ║
 # ║  - Support for input images and real-time display                         ║
 # ║  - Progress tracking and status logging                                   ║
-# ║  - Threaded API calls for responsiveness                                  ║
+# ║  - API calls on a background asyncio loop for responsiveness              ║
 # ║  Creation Date: July 22, 2025                                            ║
 # ║  Last Modified: July 22, 2025                                            ║
 # ║  Notes: Requires grok3api and Pillow; uses custom imghdr.py               ║
@@ -16,12 +16,31 @@ from tkinter import filedialog
 import ttkbootstrap as ttk
 from ttkbootstrap import Style
 from ttkbootstrap.dialogs import Messagebox
+import asyncio
+import functools
+import hashlib
+import itertools
+import queue
+import shutil
+import subprocess
+import sys
 import threading
 import time
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageTk
 import io
 
+BATCH_WINDOW_MS = 200  # Prompts submitted within this window are sent together
+MAX_BATCH_SIZE = 4  # Upper bound on requests in flight per batch
+LOG_DRAIN_MS = 50  # Queued log lines are written to the status text at this interval
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "grok_gen")
+CACHE_MAX_BYTES = 200 * 1024 * 1024  # Least recently used images are evicted beyond this
+MAX_THUMBNAILS = 20  # Gallery size; older thumbnails' widgets and Tk images are reused
+PREFETCH_LOOKAHEAD = 2  # Quick prompts prefetched on hover: the hovered one and the next
+SAFE_FILENAME_PUNCTUATION = frozenset(' -_')  # Kept in filenames alongside letters and digits
+
 class GrokImageGenerator:
     def __init__(self, root):
         self.root = root
@@ -29,23 +48,75 @@ class GrokImageGenerator:
         self.root.geometry("800x700")
         self.root.configure(bg='#2b2b2b')
 
+        # Log lines from any thread are queued and written by the UI thread in batches
+        self._log_queue = queue.Queue()
+        self._log_stamp = (0, "")  # (epoch second, formatted '%H:%M:%S') of the last log line
+
         # Initialize UI with ttkbootstrap style
         self.style = Style(theme='superhero')  # Using 'superhero' theme for a modern look
         self.setup_ui()
+        self._drain_logs()
+
+        # One background event loop runs every generation instead of a thread per request
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # Initialize client in the background so the window shows before grok3api loads
+        self.client = None
+        self.client_status = "Initializing..."
+        threading.Thread(target=self._late_import, daemon=True).start()
+
+        self.generated_images = []
+
+        # Prompts waiting for the batch window to close, and generations still running
+        self._pending = []
+        self._batch_timer = None
+        self._active_generations = 0
+
+        # Thumbnails are decoded and resized off the UI thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4)
+        # Gallery entries, oldest first: {'frame', 'label', 'photo', 'name', 'button'}
+        self._thumbnails = deque()
+
+        # (prompt, input image) -> running speculative request for a quick prompt
+        self._prefetches = {}
+
+        # Request key -> asyncio.Future of the API request running for it (loop thread only)
+        self._inflight = {}
+
+        # Numbers each generation, so concurrent ones never share output filenames
+        self._generation_ids = itertools.count(1)
+
+        # Request key -> cached image files, so repeat lookups skip the directory scan
+        self._cache_index = {}
+
+        # (path, mtime) -> validation error (None when valid) for input images
+        self._valid_cache = {}
+
+        # Image viewer command resolved once; None means os.startfile on Windows
+        self._viewer = self._find_viewer()
 
-        # Initialize client
+        # The client and its connections live as long as the window
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _late_import(self):
+        """Import grok3api and create the client off the UI thread"""
         try:
             from grok3api.client import GrokClient
-            self.client = GrokClient()
-            self.client_status = "✅ Connected to Grok"
-            self.status_label.config(text=self.client_status)
+            client, error = GrokClient(), None
         except Exception as e:
-            self.client = None
-            self.client_status = f"❌ Error: {str(e)}"
-            self.status_label.config(text=self.client_status)
-            self.log_message(f"Client initialization failed: {str(e)}")
+            client, error = None, e
+        self.root.after(0, self._client_ready, client, error)
 
-        self.generated_images = []
+    def _client_ready(self, client, error):
+        """Called on the UI thread once the client is created or has failed"""
+        self.client = client
+        if error is None:
+            self.client_status = "✅ Connected to Grok"
+        else:
+            self.client_status = f"❌ Error: {str(error)}"
+            self.log_message(f"Client initialization failed: {str(error)}")
+        self.status_label.config(text=self.client_status)
 
     def setup_ui(self):
         # Main frame
@@ -91,6 +162,8 @@ class GrokImageGenerator:
             btn = ttk.Button(quick_frame, text=prompt,
                              command=lambda p=prompt: self.set_prompt(p))
             btn.pack(side=ttk.LEFT, padx=2, pady=2)
+            # Hovering suggests the next clicks, so start those requests early
+            btn.bind("<Enter>", lambda e, i=i: self._prefetch(quick_prompts[i:i + PREFETCH_LOOKAHEAD]))
             if i == 2:  # Line break after 3 buttons
                 ttk.Frame(quick_frame).pack()
 
@@ -153,14 +226,37 @@ class GrokImageGenerator:
             self.image_path_var.set(filename)
 
     def log_message(self, message):
-        """Add message to status text"""
-        self.status_text.insert(ttk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
-        self.status_text.see(ttk.END)
-        self.root.update_idletasks()
+        """Add message to status text (safe to call from any thread)"""
+        self._log_queue.put(f"{self._timestamp()} - {message}\n")
+
+    def _timestamp(self):
+        """Current '%H:%M:%S', formatted only when the second changes"""
+        now = int(time.time())
+        second, text = self._log_stamp  # One tuple, so other threads never see a torn pair
+        if now != second:
+            text = time.strftime('%H:%M:%S', time.localtime(now))
+            self._log_stamp = (now, text)
+        return text
+
+    def _drain_logs(self):
+        """Write queued log lines in one insert, then reschedule"""
+        lines = []
+        try:
+            while len(lines) < 100:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.status_text.insert(ttk.END, "".join(lines))
+            self.status_text.see(ttk.END)
+        self.root.after(LOG_DRAIN_MS, self._drain_logs)
 
     def generate_image(self):
         if not self.client:
-            Messagebox.show_error("Error", "Grok client not connected!")
+            if self.client_status == "Initializing...":
+                Messagebox.show_warning("Please wait", "Still connecting to Grok...")
+            else:
+                Messagebox.show_error("Error", "Grok client not connected!")
             return
 
         prompt = self.prompt_var.get().strip()
@@ -168,45 +264,161 @@ class GrokImageGenerator:
             Messagebox.show_warning("Warning", "Please enter an image prompt!")
             return
 
-        # Disable button and start progress
-        self.generate_btn.configure(state='disabled')
-        self.progress.start(10)
+        # Start progress; the button stays enabled so more prompts can join the batch
+        if self._active_generations == 0:
+            self.progress.start(10)
+        self._active_generations += 1
+
+        # Capture the input image now, Tk variables are only read on the UI thread
+        image_path = self.image_path_var.get().strip() or None
+
+        # A real generation takes priority over speculative requests for other prompts
+        for request, future in list(self._prefetches.items()):
+            if request != (prompt, image_path):
+                future.cancel()
+        self._pending.append((prompt, image_path))
+        if self._batch_timer is None:
+            self._batch_timer = self.root.after(BATCH_WINDOW_MS, self._flush_batch)
+
+    def _flush_batch(self):
+        """Send the prompts collected during the batch window as one batch"""
+        batch = self._pending[:MAX_BATCH_SIZE]
+        del self._pending[:MAX_BATCH_SIZE]
+        # Overflow goes out as the next batch straight away
+        self._batch_timer = self.root.after(0, self._flush_batch) if self._pending else None
+
+        if len(batch) > 1:
+            self.log_message(f"📦 Sending {len(batch)} prompts as one batch")
+        asyncio.run_coroutine_threadsafe(self._generate_batch(batch), self._loop)
+
+    async def _generate_batch(self, batch):
+        """Run every request of a batch concurrently on the background loop"""
+        await asyncio.gather(*(self._generate_async(prompt, image_path) for prompt, image_path in batch))
+
+    async def _save_image(self, image, filename, i):
+        """Save one generated image and show it; returns the filename or None on failure"""
+        try:
+            shown = []
+
+            def show_downloaded(data):
+                # Show the thumbnail from memory while the file is still being written
+                shown.append(filename)
+                self.root.after(0, self._add_image_to_gui, filename, data)
+
+            # Save image (blocking file I/O stays off the event loop)
+            if not await self._loop.run_in_executor(None, self._write_image, image, filename, show_downloaded):
+                self.log_message(f"⚠️ Image object found but no save method available: {type(image)}")
+                return None
+            if not shown:
+                self.root.after(0, self._add_image_to_gui, filename)
+
+            self.log_message(f"💾 Saved: {filename}")
+            return filename
+
+        except Exception as save_error:
+            self.log_message(f"❌ Error saving image {i}: {save_error}")
+            return None
 
-        # Run generation in separate thread
-        thread = threading.Thread(target=self._generate_thread, args=(prompt,))
-        thread.daemon = True
-        thread.start()
+    def _prefetch(self, prompts):
+        """Start background requests for quick prompts the user is likely to pick"""
+        if not self.client:
+            return
+        image_path = self.image_path_var.get().strip() or None
+        for prompt in prompts:
+            request = (prompt, image_path)
+            if request in self._prefetches or len(self._prefetches) >= PREFETCH_LOOKAHEAD:
+                continue
+            future = asyncio.run_coroutine_threadsafe(self._prefetch_async(prompt, image_path), self._loop)
+            self._prefetches[request] = future
+            future.add_done_callback(lambda f, r=request: self._prefetches.pop(r, None))
+
+    async def _prefetch_async(self, prompt, image_path):
+        """Generate a quick prompt straight into the image cache"""
+        if image_path and not os.path.isfile(image_path):
+            image_path = None
+        formatted_prompt = f"Create an image of {prompt}"
+        cache_key = await self._loop.run_in_executor(None, self._cache_key, formatted_prompt, image_path)
+        if await self._loop.run_in_executor(None, self._cached_files, cache_key):
+            return
+        if cache_key in self._inflight:
+            return  # Already being generated
 
-    def _generate_thread(self, prompt):
+        request = self._inflight[cache_key] = self._loop.create_future()
         try:
-            self.log_message(f"🎨 Generating image: '{prompt}'")
+            self.log_message(f"🔮 Prefetching: '{prompt}'")
+            if image_path:
+                result = await self._ask_async(message=formatted_prompt, images=image_path)
+            else:
+                result = await self._ask_async(message=formatted_prompt)
+
+            images = getattr(getattr(result, 'modelResponse', None), 'generatedImages', None)
+            cached = []
+            if images:
+                cached = await self._loop.run_in_executor(None, self._save_to_cache, cache_key, images)
+            if not cached:
+                self.log_message(f"⚠️ Prefetch of '{prompt}' produced no images that could be cached")
+        except Exception as e:
+            self.log_message(f"❌ Prefetch of '{prompt}' failed: {e}")
+        finally:
+            self._release_request(cache_key, request)
+
+    async def _ask_async(self, **kwargs):
+        """Send a request to Grok without blocking the event loop"""
+        if hasattr(self.client, 'async_ask'):
+            return await self.client.async_ask(**kwargs)
+        # Synchronous client: run the blocking call on the loop's default executor
+        return await self._loop.run_in_executor(None, functools.partial(self.client.ask, **kwargs))
 
-            # Prepare parameters
-            image_path = self.image_path_var.get().strip() if self.image_path_var.get().strip() else None
+    async def _generate_async(self, prompt, image_path=None):
+        cache_key = owned_request = None
+        try:
+            self.log_message(f"🎨 Generating image: '{prompt}'")
 
             if image_path and not os.path.exists(image_path):
                 self.log_message(f"⚠️ Warning: Input image not found: {image_path}")
                 image_path = None
-            else:
-                try:
-                    Image.open(image_path)  # Verify image
+            elif image_path:
+                error = await self._loop.run_in_executor(None, self._check_input_image, image_path)
+                if error is None:
                     self.log_message(f"📁 Valid input image: {os.path.basename(image_path)}")
-                except Exception as e:
-                    self.log_message(f"❌ Invalid input image: {e}")
+                else:
+                    self.log_message(f"❌ Invalid input image: {error}")
                     image_path = None
 
             # Standardize prompt for image generation
             formatted_prompt = f"Create an image of {prompt}"
             self.log_message(f"📝 Formatted prompt: '{formatted_prompt}'")
 
+            # Identical requests are served from the image cache without calling the API;
+            # one already running (another click or a prefetch) is awaited, then the cache rechecked
+            cache_key = await self._loop.run_in_executor(None, self._cache_key, formatted_prompt, image_path)
+            while True:
+                cached_files = await self._loop.run_in_executor(None, self._cached_files, cache_key)
+                if cached_files:
+                    # Copies get the usual output names, so eviction never breaks the gallery
+                    saved_files = await self._loop.run_in_executor(
+                        None, self._copy_from_cache, cached_files, self._output_stem(prompt))
+                    if saved_files:
+                        self.log_message(f"♻️ Using {len(saved_files)} cached image(s)")
+                        for saved_file in saved_files:
+                            self.root.after(0, self._add_image_to_gui, saved_file)
+                        return
+                    continue  # Evicted meanwhile; the recheck no longer finds them
+                in_flight = self._inflight.get(cache_key)
+                if in_flight is None:
+                    break
+                self.log_message("🔗 Identical request already running, waiting for it")
+                await asyncio.shield(in_flight)
+            owned_request = self._inflight[cache_key] = self._loop.create_future()
+
             start_time = time.time()
 
             # Make the API call
             if image_path:
-                result = self.client.ask(message=formatted_prompt, images=image_path)
+                result = await self._ask_async(message=formatted_prompt, images=image_path)
                 self.log_message(f"📁 Used input image: {os.path.basename(image_path)}")
             else:
-                result = self.client.ask(message=formatted_prompt)
+                result = await self._ask_async(message=formatted_prompt)
 
             duration = time.time() - start_time
             self.log_message(f"⏱️ Request completed in {duration:.1f} seconds")
@@ -217,28 +429,21 @@ class GrokImageGenerator:
                 if hasattr(result.modelResponse, 'generatedImages') and result.modelResponse.generatedImages:
                     self.log_message(f"🖼️ Found {len(result.modelResponse.generatedImages)} generated image(s)!")
 
-                    for i, image in enumerate(result.modelResponse.generatedImages):
+                    # Filename stem is shared by every image of the response
+                    stem = self._output_stem(prompt)
+
+                    # Images are independent, so they download and save concurrently
+                    saved = await asyncio.gather(*(
+                        self._save_image(image, f"{stem}_{i}.jpg", i)
+                        for i, image in enumerate(result.modelResponse.generatedImages)
+                    ))
+                    saved_files = [filename for filename in saved if filename]
+
+                    if saved_files:
                         try:
-                            # Generate filename
-                            timestamp = int(time.time())
-                            safe_prompt = "".join(c for c in prompt if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                            safe_prompt = safe_prompt.replace(' ', '_')[:30]
-                            filename = f"grok_{safe_prompt}_{timestamp}_{i}.jpg"
-
-                            # Save image
-                            if hasattr(image, 'save_to'):
-                                image.save_to(filename)
-                            elif hasattr(image, 'save'):
-                                image.save(filename)
-                            else:
-                                self.log_message(f"⚠️ Image object found but no save method available: {type(image)}")
-                                continue
-
-                            self.log_message(f"💾 Saved: {filename}")
-                            self.root.after(0, self._add_image_to_gui, filename)
-
-                        except Exception as save_error:
-                            self.log_message(f"❌ Error saving image {i}: {save_error}")
+                            await self._loop.run_in_executor(None, self._store_in_cache, cache_key, saved_files)
+                        except OSError as cache_error:
+                            self.log_message(f"⚠️ Could not cache images: {cache_error}")
                 else:
                     self.log_message("📝 No images were generated in the response")
             else:
@@ -248,32 +453,204 @@ class GrokImageGenerator:
             self.log_message(f"❌ Error: {str(e)}")
 
         finally:
+            if owned_request is not None:
+                self._release_request(cache_key, owned_request)
             self.root.after(0, self._generation_complete)
 
-    def _add_image_to_gui(self, filename):
-        """Add generated image to the GUI display"""
+    def _output_stem(self, prompt):
+        """Filename stem shared by every image saved for one generation, unique within the session"""
+        safe_prompt = "".join(c for c in prompt if c.isalnum() or c in SAFE_FILENAME_PUNCTUATION).rstrip()
+        safe_prompt = safe_prompt.replace(' ', '_')[:30]
+        return f"grok_{safe_prompt}_{int(time.time())}_{next(self._generation_ids)}"
+
+    def _copy_from_cache(self, cached_files, stem):
+        """Copy cached images to output filenames, skipping any evicted in the meantime"""
+        saved_files = []
+        for i, cached_file in enumerate(cached_files):
+            filename = f"{stem}_{i}.jpg"
+            try:
+                shutil.copyfile(cached_file, filename)
+            except FileNotFoundError:
+                continue
+            saved_files.append(filename)
+        return saved_files
+
+    def _release_request(self, cache_key, request):
+        """Unregister a finished request and wake anything waiting on it"""
+        self._inflight.pop(cache_key, None)
+        request.set_result(None)
+
+    def _check_input_image(self, image_path):
+        """Verify an input image once per (path, mtime); returns an error or None"""
+        key = (image_path, os.path.getmtime(image_path))
+        if key not in self._valid_cache:
+            try:
+                with Image.open(image_path) as img:
+                    img.verify()  # Integrity check without decoding the pixels
+                self._valid_cache[key] = None
+            except Exception as e:
+                self._valid_cache[key] = str(e)
+        return self._valid_cache[key]
+
+    def _cache_key(self, formatted_prompt, image_path):
+        """SHA-256 of the prompt and the input image bytes"""
+        digest = hashlib.sha256(formatted_prompt.encode('utf-8'))
+        if image_path:
+            with open(image_path, 'rb') as f:
+                digest.update(b'\0')
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def _cached_files(self, key):
+        """Return the cached images for a request key, marking them as recently used"""
+        files = self._cache_index.get(key)
+        if files is None:
+            if not os.path.isdir(CACHE_DIR):
+                return []
+            files = sorted(os.path.join(CACHE_DIR, name) for name in os.listdir(CACHE_DIR)
+                           if name.startswith(key + "_"))
+        touched = []
+        for f in files:
+            try:
+                os.utime(f)  # The mtime doubles as the LRU timestamp
+            except FileNotFoundError:
+                continue  # Evicted by another thread
+            touched.append(f)
+        if touched:
+            self._cache_index[key] = touched
+        return touched
+
+    def _store_in_cache(self, key, filenames):
+        """Copy freshly saved images into the cache, then trim it to size"""
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        files = []
+        for i, filename in enumerate(filenames):
+            cached_file = os.path.join(CACHE_DIR, f"{key}_{i}.jpg")
+            shutil.copyfile(filename, cached_file)
+            files.append(cached_file)
+        self._cache_index[key] = files
+        self._evict_cache()
+
+    def _save_to_cache(self, key, images):
+        """Save API result images directly into the cache; returns the cached files"""
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        files = []
+        for i, image in enumerate(images):
+            cached_file = os.path.join(CACHE_DIR, f"{key}_{i}.jpg")
+            try:
+                if not self._write_image(image, cached_file):
+                    continue
+            except Exception as e:
+                self.log_message(f"❌ Error caching image {i}: {e}")
+                continue
+            files.append(cached_file)
+        if files:
+            self._cache_index[key] = files
+            self._evict_cache()
+        return files
+
+    def _evict_cache(self):
+        """Delete the least recently used images until the cache fits CACHE_MAX_BYTES"""
+        entries = []
+        for entry in os.scandir(CACHE_DIR):
+            try:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path, entry.name))
+            except FileNotFoundError:
+                continue  # Removed by another thread while scanning
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, path, name in sorted(entries):
+            if total <= CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Another thread evicted it first
+            total -= size
+            self._cache_index.pop(name.rsplit("_", 1)[0], None)
+
+    def _write_image(self, image, filename, on_data=None):
+        """Write an API image with whichever method it offers; returns False if it has none"""
+        if hasattr(image, 'download'):
+            buffer = image.download()
+            if buffer is None:
+                raise ValueError("download returned no data")
+            data = buffer.getvalue()
+            if on_data is not None:
+                on_data(data)
+            self._write_file(filename, data)
+        elif hasattr(image, 'save_to'):
+            image.save_to(filename)
+        elif hasattr(image, 'save'):
+            image.save(filename)
+        else:
+            return False
+        return True
+
+    def _write_file(self, filename, data):
+        """Write downloaded image bytes to disk"""
+        with open(filename, 'wb') as f:
+            f.write(data)
+
+    def _add_image_to_gui(self, filename, data=None):
+        """Add generated image to the GUI display, decoding from data when given"""
+        # Decode in the pool; only PhotoImage creation and packing run on the UI thread
+        future = self._thumb_pool.submit(self._decode_thumbnail, filename, data)
+        future.add_done_callback(lambda f: self.root.after(0, self._place_thumbnail, filename, f))
+
+    def _decode_thumbnail(self, filename, data=None):
+        """Decode and resize an image to thumbnail size, returning raw pixels"""
+        if data is None and not os.path.exists(filename):
+            raise FileNotFoundError(filename)
+        with Image.open(io.BytesIO(data) if data is not None else filename) as img:
+            img.draft("RGB", (300, 300))  # JPEGs decode at reduced scale in libjpeg
+            img.thumbnail((150, 150), Image.Resampling.LANCZOS)
+            mode = "RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB"
+            img = img.convert(mode)
+            return mode, img.size, img.tobytes()
+
+    def _place_thumbnail(self, filename, future):
+        """Show a decoded thumbnail in the images frame"""
         try:
-            if not os.path.exists(filename):
+            try:
+                mode, size, data = future.result()
+            except FileNotFoundError:
                 self.log_message(f"❌ Image file not found: {filename}")
                 return
-            img = Image.open(filename)
-            img.thumbnail((150, 150), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+            img = Image.frombytes(mode, size, data)
 
-            img_frame = ttk.Frame(self.images_inner_frame)
-            img_frame.pack(side=ttk.LEFT, padx=5, pady=5)
+            if len(self._thumbnails) < MAX_THUMBNAILS:
+                img_frame = ttk.Frame(self.images_inner_frame)
 
-            img_label = ttk.Label(img_frame, image=photo)
-            img_label.image = photo
-            img_label.pack()
+                img_label = ttk.Label(img_frame)
+                img_label.pack()
 
-            name_label = ttk.Label(img_frame, text=os.path.basename(filename),
-                                   font=('Arial', 8))
-            name_label.pack()
+                name_label = ttk.Label(img_frame, font=('Arial', 8))
+                name_label.pack()
 
-            open_btn = ttk.Button(img_frame, text="Open",
-                                  command=lambda f=filename: os.startfile(f))
-            open_btn.pack(pady=(2, 0))
+                open_btn = ttk.Button(img_frame, text="Open")
+                open_btn.pack(pady=(2, 0))
+
+                thumb = {'frame': img_frame, 'label': img_label, 'photo': None,
+                         'name': name_label, 'button': open_btn}
+            else:
+                # Gallery is full: recycle the oldest entry and move it to the end
+                thumb = self._thumbnails.popleft()
+                thumb['frame'].pack_forget()
+
+            photo = thumb['photo']
+            if photo is not None and (photo.width(), photo.height()) == img.size:
+                photo.paste(img)  # Reuse the existing Tk image
+            else:
+                photo = ImageTk.PhotoImage(img)
+                thumb['label'].configure(image=photo)
+                thumb['label'].image = photo
+                thumb['photo'] = photo
+            thumb['name'].configure(text=os.path.basename(filename))
+            thumb['button'].configure(command=lambda f=filename: self._open_image(f))
+            thumb['frame'].pack(side=ttk.LEFT, padx=5, pady=5)
+            self._thumbnails.append(thumb)
 
             self.images_inner_frame.update_idletasks()
             self.images_canvas.configure(scrollregion=self.images_canvas.bbox("all"))
@@ -283,15 +660,53 @@ class GrokImageGenerator:
         except Exception as e:
             self.log_message(f"❌ Error displaying image: {e}")
 
+    def _find_viewer(self):
+        """Return the command that opens files in the default viewer"""
+        if sys.platform == 'win32':
+            return None
+        if sys.platform == 'darwin':
+            return 'open'
+        return shutil.which('xdg-open')
+
+    def _open_image(self, filename):
+        """Open an image in the default viewer without blocking the UI thread"""
+        threading.Thread(target=self._launch_viewer, args=(filename,), daemon=True).start()
+
+    def _launch_viewer(self, filename):
+        try:
+            if self._viewer:
+                subprocess.Popen([self._viewer, filename])
+            elif sys.platform == 'win32':
+                os.startfile(filename)
+            else:
+                self.log_message("❌ No image viewer found (install xdg-utils)")
+        except Exception as e:
+            self.log_message(f"❌ Could not open {filename}: {e}")
+
     def _generation_complete(self):
         """Called when generation is complete"""
-        self.progress.stop()
-        self.generate_btn.configure(state='normal')
+        self._active_generations -= 1
+        if self._active_generations == 0:
+            self.progress.stop()
         self.log_message("✅ Generation complete!\n" + "─" * 50)
 
+    def _on_close(self):
+        """Stop background work and release the client before closing the window"""
+        for future in list(self._prefetches.values()):
+            future.cancel()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thumb_pool.shutdown(wait=False)
+        close = getattr(self.client, 'close', None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass  # The process is exiting anyway
+        self.root.destroy()
+
 def main():
     root = ttk.Window(themename="superhero")
-    app = GrokImageGenerator(root)
+    GrokImageGenerator(root)
     root.mainloop()
 
 if __name__ == "__main__":
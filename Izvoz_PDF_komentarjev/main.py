@@ -5,12 +5,15 @@ PDF Komentarji Izvoz - GUI način
 """
 
 import os
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox
-from pdf_komentarji_izvoz import PDFKomentarjiIzvoz
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import filedialog, messagebox, ttk
 
 def gui_nacin():
     """GUI način za enostavno uporabo"""
+    preklic = None  # threading.Event trenutne obdelave
+
     def izberi_datoteko():
         pot = filedialog.askopenfilename(
             title="Izberi PDF datoteko",
@@ -21,30 +24,82 @@ def gui_nacin():
             obdelaj_pdf(pot)
 
     def obdelaj_pdf(pot):
-        base_name = os.path.splitext(pot)[0]
-        annotation_datoteka = f"{base_name}_komentarji_improved.annotation"
-        porocilo_pdf = f"{base_name}_porocilo_improved.pdf"
-        porocilo_excel = f"{base_name}_porocilo_improved.xlsx"
-
-        izvoznik = PDFKomentarjiIzvoz()
-        if not izvoznik.preberi_pdf_komentarje(pot):
-            messagebox.showerror("Napaka", "Ni uspelo prebrati komentarjev iz PDF.")
-            return
-
-        uspesno = []
-        if izvoznik.izvozi_v_annotation(annotation_datoteka):
-            uspesno.append(annotation_datoteka)
-        if izvoznik.ustvari_porocilo_pdf(porocilo_pdf):
-            uspesno.append(porocilo_pdf)
-        if izvoznik.ustvari_excel_porocilo(porocilo_excel):
-            uspesno.append(porocilo_excel)
-
-        if uspesno:
+        """Zažene obdelavo v ozadju, da okno ostane odzivno"""
+        nonlocal preklic
+        preklic = threading.Event()
+        gumb.config(state=tk.DISABLED)
+        preklici_gumb.config(state=tk.NORMAL)
+        napredek.start(10)
+        threading.Thread(target=obdelaj_v_ozadju, args=(pot, preklic), daemon=True).start()
+
+    def obdelaj_v_ozadju(pot, preklic):
+        """Prebere PDF in ustvari izvoze; rezultat vedno vrne v glavno nit prek okno.after"""
+        napaka, uspesno = None, []
+        try:
+            base_name = os.path.splitext(pot)[0]
+            annotation_datoteka = f"{base_name}_komentarji_improved.annotation"
+            porocilo_pdf = f"{base_name}_porocilo_improved.pdf"
+            porocilo_excel = f"{base_name}_porocilo_improved.xlsx"
+
+            # PyPDF2, reportlab in openpyxl se naložijo šele ob prvi obdelavi, ne ob zagonu okna
+            try:
+                from pdf_komentarji_izvoz import PDFKomentarjiIzvoz
+            except SystemExit:  # Modul ob manjkajoči knjižnici pokliče sys.exit
+                napaka = "Manjka potrebna knjižnica.\nNamestite z: pip install PyPDF2 reportlab openpyxl"
+                return
+
+            izvoznik = PDFKomentarjiIzvoz()
+            if not izvoznik.preberi_pdf_komentarje(pot):
+                napaka = "Ni uspelo prebrati komentarjev iz PDF."
+                return
+            if preklic.is_set():
+                return
+
+            # Izvozi le berejo prebrane komentarje in pišejo vsak svojo datoteko, zato tečejo hkrati
+            with ThreadPoolExecutor(max_workers=3) as izvajalec:
+                opravila = [
+                    (izvajalec.submit(izvoznik.izvozi_v_annotation, annotation_datoteka), annotation_datoteka),
+                    (izvajalec.submit(izvoznik.ustvari_porocilo_pdf, porocilo_pdf), porocilo_pdf),
+                    (izvajalec.submit(izvoznik.ustvari_excel_porocilo, porocilo_excel), porocilo_excel),
+                ]
+                uspesno = [izhod for opravilo, izhod in opravila if opravilo.result()]
+        except Exception as e:
+            napaka = f"Napaka pri obdelavi: {e}"
+        finally:
+            # Gumbi ostanejo zaklenjeni, dokler se nit res ne konča, zato se obdelavi nikoli ne prekrivata
+            try:
+                okno.after(0, koncano, preklic, napaka, uspesno)
+            except (RuntimeError, tk.TclError):
+                pass  # Okno je že zaprto
+
+    def koncano(preklic, napaka, uspesno):
+        """Pospravi po obdelavi in prikaže rezultat (v glavni niti)"""
+        napredek.stop()
+        gumb.config(state=tk.NORMAL)
+        preklici_gumb.config(state=tk.DISABLED)
+        if preklic.is_set():
+            vhod_label.config(text="Obdelava preklicana")
+        elif napaka:
+            messagebox.showerror("Napaka", napaka)
+        elif uspesno:
             messagebox.showinfo("Končano", "Ustvarjene datoteke:\n" + "\n".join(uspesno))
 
+    def preklici():
+        """Prekliče trenutno obdelavo; izvozi se ne shranijo, če še niso začeti"""
+        if preklic:
+            preklic.set()
+        preklici_gumb.config(state=tk.DISABLED)
+        vhod_label.config(text="Preklicujem ... (počakajte, da se trenutni korak konča)")
+
+    def zapri():
+        if preklic:
+            preklic.set()
+        okno.destroy()
+
     okno = tk.Tk()
     okno.title("PDF Komentarji Izvoz")
-    okno.geometry("400x200")
+    okno.geometry("400x260")
+    okno.protocol("WM_DELETE_WINDOW", zapri)
 
     navodilo = tk.Label(okno, text="Izberi PDF datoteko za izvoz komentarjev:")
     navodilo.pack(pady=10)
@@ -55,6 +110,12 @@ def gui_nacin():
     vhod_label = tk.Label(okno, text="Nobena datoteka ni izbrana", wraplength=350)
     vhod_label.pack(pady=10)
 
+    napredek = ttk.Progressbar(okno, mode='indeterminate', length=300)
+    napredek.pack(pady=5)
+
+    preklici_gumb = tk.Button(okno, text="Prekliči", command=preklici, state=tk.DISABLED)
+    preklici_gumb.pack(pady=5)
+
     okno.mainloop()
 
 if __name__ == "__main__":
@@ -20,9 +20,11 @@ import os
 import sys
 import json
 import hashlib
+import heapq
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import PyPDF2
@@ -40,6 +42,34 @@ except ImportError as e:
     print("Namestite z: pip install PyPDF2 reportlab openpyxl")
     sys.exit(1)
 
+# Neobvezno: rapidfuzz (C++) je pri primerjanju podobnosti precej hitrejši od difflib
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+# Neobvezno: pypdfium2 izvleče besedilo strani hitreje in natančneje od PyPDF2
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# Neobvezno: xxhash je za (nekriptografske) podpise vsebine hitrejši od hashlib
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Neobvezno: MinHash-LSH indeks za iskanje skoraj podvojenih vnosov v zelo velikih skupinah
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
+LSH_NUM_PERM = 64
+LSH_PRAG = 0.5  # Jaccard prag za kandidate; o duplikatu še vedno odloči podobnost_prag
+LSH_MIN_VNOSOV = 500  # Pod toliko vnosi na skupino je linearno primerjanje hitrejše od indeksa
+
 # Registracija Unicode pisav za PDF
 try:
     pdfmetrics.registerFont(TTFont('DejaVuSans', 'DejaVuSans.ttf'))
@@ -49,6 +79,10 @@ except:
     print("Opozorilo: DejaVu pisave niso najdene - uporabljam Helvetica")
     UNICODE_FONTS_AVAILABLE = False
 
+# Predpomnilnik prebranih PDF-jev: (pot, mtime, velikost, prag) -> (komentarji, oznaceno_besedilo)
+_PREBRANI_PDF = OrderedDict()
+_PREBRANI_PDF_MAX = 16
+
 
 class PDFKomentarjiIzvoz:
     def __init__(self, podobnost_prag=0.95):
@@ -58,6 +92,7 @@ class PDFKomentarjiIzvoz:
         self._nastavi_sloge()
         self._processed_signatures = set()
         self._content_cache = {}
+        self._lsh_indeksi = {}
         self.podobnost_prag = podobnost_prag
         self.markup_types = {'/Highlight', '/Underline', '/StrikeOut', '/Squiggly'}
 
@@ -96,24 +131,48 @@ class PDFKomentarjiIzvoz:
             leftIndent=10
         ))
 
-    def _calculate_text_similarity(self, text1, text2):
+    def _calculate_text_similarity(self, text1, text2, already_normalized=False):
         """Izračuna podobnost med dvema tekstoma"""
         if not text1 or not text2:
             return 0.0
 
-        t1 = text1.strip().lower()
-        t2 = text2.strip().lower()
+        if already_normalized:
+            t1, t2 = text1, text2
+        else:
+            t1 = text1.strip().lower()
+            t2 = text2.strip().lower()
 
         if t1 == t2:
             return 1.0
 
+        if fuzz is not None:
+            return fuzz.ratio(t1, t2) / 100.0
         return SequenceMatcher(None, t1, t2).ratio()
 
     def _create_content_signature(self, content, page_num, annotation_type):
         """Ustvari podpis na podlagi vsebine"""
         normalized_content = content.strip().lower()[:200]
         signature_string = f"{page_num}_{annotation_type}_{normalized_content}"
-        return hashlib.md5(signature_string.encode('utf-8')).hexdigest()
+        podatki = signature_string.encode('utf-8')
+        if xxhash is not None:
+            return xxhash.xxh3_128(podatki).hexdigest()
+        return hashlib.blake2b(podatki, digest_size=16).hexdigest()
+
+    def _minhash(self, besedilo):
+        """MinHash znakovnih 3-gramov že normaliziranega besedila"""
+        minhash = MinHash(num_perm=LSH_NUM_PERM)
+        minhash.update_batch([besedilo[i:i + 3].encode('utf-8') for i in range(max(1, len(besedilo) - 2))])
+        return minhash
+
+    def _lsh_indeks(self, cache_key, vnosi):
+        """Vrne LSH indeks skupine; zgradi ga, ko skupina doseže LSH_MIN_VNOSOV"""
+        lsh = self._lsh_indeksi.get(cache_key)
+        if lsh is None and MinHashLSH is not None and len(vnosi) >= LSH_MIN_VNOSOV:
+            lsh = MinHashLSH(threshold=LSH_PRAG, num_perm=LSH_NUM_PERM)
+            for i, vnos in enumerate(vnosi):
+                lsh.insert(i, self._minhash(vnos))
+            self._lsh_indeksi[cache_key] = lsh
+        return lsh
 
     def _is_duplicate_content(self, new_content, page_num, annotation_type):
         """Preveri duplikat na podlagi vsebine"""
@@ -121,14 +180,39 @@ class PDFKomentarjiIzvoz:
 
         if cache_key not in self._content_cache:
             self._content_cache[cache_key] = []
-
-        for existing_content in self._content_cache[cache_key]:
-            similarity = self._calculate_text_similarity(new_content, existing_content)
-            if similarity >= self.podobnost_prag:
-                print(f"   → Zaznan duplikat (podobnost: {similarity:.2%})")
+        # Predpomnilnik hrani že normalizirane vnose, zato vsakega normaliziramo le enkrat
+        vnosi = self._content_cache[cache_key]
+        normalizirano = new_content.strip().lower()
+
+        # V velikih skupinah LSH vrne le verjetne kandidate, ki jih nato natančno preverimo
+        lsh = self._lsh_indeks(cache_key, vnosi)
+        if lsh is not None:
+            minhash = self._minhash(normalizirano)
+            kandidati = [vnosi[i] for i in lsh.query(minhash)]
+        else:
+            kandidati = vnosi
+
+        if process is not None:
+            # En klic namesto zanke: rapidfuzz v C++ poišče najbolj podoben vnos nad pragom
+            zadetek = process.extractOne(
+                normalizirano, kandidati,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=self.podobnost_prag * 100
+            )
+            if zadetek is not None:
+                print(f"   → Zaznan duplikat (podobnost: {zadetek[1] / 100:.2%})")
                 return True
-
-        self._content_cache[cache_key].append(new_content)
+        else:
+            for existing_content in kandidati:
+                similarity = self._calculate_text_similarity(normalizirano, existing_content, already_normalized=True)
+                if similarity >= self.podobnost_prag:
+                    print(f"   → Zaznan duplikat (podobnost: {similarity:.2%})")
+                    return True
+
+        if lsh is not None:
+            lsh.insert(len(vnosi), minhash)
+        vnosi.append(normalizirano)
         return False
 
     def _extract_marked_text_advanced(self, page, annotation_obj, page_text, tip):
@@ -177,9 +261,40 @@ class PDFKomentarjiIzvoz:
             print(f"   → Napaka pri izvlečenju: {e}")
             return "[Napaka pri branju]"
 
+    def _besedilo_strani(self, stran, pdfium_doc, st_strani):
+        """Vrne besedilo strani; s pypdfium2, če je na voljo, sicer s PyPDF2"""
+        if pdfium_doc is not None:
+            pdfium_stran = pdfium_doc[st_strani - 1]
+            textpage = pdfium_stran.get_textpage()
+            try:
+                return textpage.get_text_range() or ""
+            finally:
+                textpage.close()
+                pdfium_stran.close()
+        return stran.extract_text() or ""
+
     def preberi_pdf_komentarje(self, pdf_pot):
         """Prebere komentarje z napredno detekcijo"""
+        pdfium_doc = None
+        izvlecevalnik = None
         try:
+            # Nespremenjen PDF ne beremo znova
+            st = os.stat(pdf_pot)
+            kljuc = (os.path.abspath(pdf_pot), st.st_mtime_ns, st.st_size, self.podobnost_prag)
+            if kljuc in _PREBRANI_PDF:
+                _PREBRANI_PDF.move_to_end(kljuc)
+                komentarji, oznaceno_besedilo = _PREBRANI_PDF[kljuc]
+                self.komentarji = list(komentarji)
+                self.oznaceno_besedilo = list(oznaceno_besedilo)
+                print(f"✓ Uporabljam že prebrane komentarje: {pdf_pot}")
+                return True
+
+            if pdfium is not None:
+                try:
+                    pdfium_doc = pdfium.PdfDocument(pdf_pot)
+                except Exception as e:
+                    print(f"Opozorilo: pypdfium2 ne more odpreti PDF ({e}) - uporabljam PyPDF2")
+
             with open(pdf_pot, 'rb') as datoteka:
                 pdf_reader = PyPDF2.PdfReader(datoteka)
                 print(f"\n{'=' * 60}")
@@ -191,16 +306,37 @@ class PDFKomentarjiIzvoz:
                 self.oznaceno_besedilo.clear()
                 self._processed_signatures.clear()
                 self._content_cache.clear()
+                self._lsh_indeksi.clear()
 
                 stats = {'komentarji': 0, 'oznaceno': 0, 'duplikati': 0}
 
+                # pdfium ni varen za več niti, zato besedilo vseh strani izvleče ena nit,
+                # ki prehiteva obdelavo anotacij (klici prek ctypes sprostijo GIL)
+                besedila_strani = {}
+                if pdfium_doc is not None:
+                    izvlecevalnik = ThreadPoolExecutor(max_workers=1)
+                    besedila_strani = {
+                        st_strani: izvlecevalnik.submit(self._besedilo_strani, stran, pdfium_doc, st_strani)
+                        for st_strani, stran in enumerate(pdf_reader.pages, 1)
+                        if '/Annots' in stran
+                    }
+
                 for st_strani, stran in enumerate(pdf_reader.pages, 1):
                     print(f"\nObdelavam stran {st_strani}...")
 
+                    # Podpisi in skupine vsebin vključujejo številko strani, zato stanje
+                    # deduplikacije prejšnje strani ni več potrebno
+                    self._processed_signatures.clear()
+                    self._content_cache.clear()
+                    self._lsh_indeksi.clear()
+
                     if '/Annots' not in stran:
                         continue
 
-                    page_text = stran.extract_text() or ""
+                    if st_strani in besedila_strani:
+                        page_text = besedila_strani.pop(st_strani).result()  # Besedila obdelanih strani ne držimo v spominu
+                    else:
+                        page_text = self._besedilo_strani(stran, None, st_strani)
 
                     for anotacija in stran['/Annots']:
                         try:
@@ -278,11 +414,20 @@ class PDFKomentarjiIzvoz:
                 print(f"⚠ Odstranjeni duplikati: {stats['duplikati']}")
                 print(f"{'=' * 60}")
 
+                _PREBRANI_PDF[kljuc] = (list(self.komentarji), list(self.oznaceno_besedilo))
+                if len(_PREBRANI_PDF) > _PREBRANI_PDF_MAX:
+                    _PREBRANI_PDF.popitem(last=False)
+
                 return True
 
         except Exception as e:
             print(f"✗ Napaka pri branju PDF: {e}")
             return False
+        finally:
+            if izvlecevalnik is not None:
+                izvlecevalnik.shutdown(cancel_futures=True)
+            if pdfium_doc is not None:
+                pdfium_doc.close()
 
     def _format_date(self, date_str):
         """Formatira datum iz PDF formata"""
@@ -297,15 +442,13 @@ class PDFKomentarjiIzvoz:
     def izvozi_v_annotation(self, izhod_pot):
         """Izvozi v JSON format z metapodatki o deduplikaciji"""
         try:
-            vsi_elementi = []
-
-            for kom in self.komentarji:
-                vsi_elementi.append({**kom, 'vrsta': 'komentar'})
-
-            for ozn in self.oznaceno_besedilo:
-                vsi_elementi.append({**ozn, 'vrsta': 'oznaceno'})
-
-            vsi_elementi.sort(key=lambda x: x['stran'])
+            # Oba seznama sta urejena po straneh, zato ju zlijemo sproti, brez skupnega seznama
+            vsi_elementi = heapq.merge(
+                ({**kom, 'vrsta': 'komentar'} for kom in self.komentarji),
+                ({**ozn, 'vrsta': 'oznaceno'} for ozn in self.oznaceno_besedilo),
+                key=lambda x: x['stran']
+            )
+            strani = {el['stran'] for el in self.komentarji} | {el['stran'] for el in self.oznaceno_besedilo}
 
             data = {
                 'metadata': {
@@ -313,8 +456,8 @@ class PDFKomentarjiIzvoz:
                     'izvoz_datum': datetime.now().isoformat(),
                     'stevilo_komentarjev': len(self.komentarji),
                     'stevilo_oznacenega': len(self.oznaceno_besedilo),
-                    'stevilo_skupaj': len(vsi_elementi),
-                    'strani_z_anotacijami': len(set(el['stran'] for el in vsi_elementi)),
+                    'stevilo_skupaj': len(self.komentarji) + len(self.oznaceno_besedilo),
+                    'strani_z_anotacijami': len(strani),
                     'deduplikacija': {
                         'omogocena': True,
                         'podobnost_prag': self.podobnost_prag,
@@ -327,7 +470,7 @@ class PDFKomentarjiIzvoz:
             }
 
             with open(izhod_pot, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                self._zapisi_json(f, data)
 
             print(f"✓ Komentarji izvoženi v: {izhod_pot}")
             return True
@@ -336,6 +479,27 @@ class PDFKomentarjiIzvoz:
             print(f"✗ Napaka pri izvozu v .annotation: {e}")
             return False
 
+    def _zapisi_json(self, f, data):
+        """Zapiše slovar kot json.dump(indent=2), elemente iteratorjev pa sproti enega za drugim"""
+        def zapisi(vrednost, zamik):
+            return json.dumps(vrednost, ensure_ascii=False, indent=2).replace('\n', '\n' + zamik)
+
+        f.write('{')
+        for i, (kljuc, vrednost) in enumerate(data.items()):
+            f.write(',\n  ' if i else '\n  ')
+            f.write(f'{json.dumps(kljuc, ensure_ascii=False)}: ')
+            if isinstance(vrednost, (dict, list)):
+                f.write(zapisi(vrednost, '  '))
+                continue
+            f.write('[')
+            prazen = True
+            for element in vrednost:
+                f.write('\n    ' if prazen else ',\n    ')
+                f.write(zapisi(element, '    '))
+                prazen = False
+            f.write(']' if prazen else '\n  ]')
+        f.write('\n}')
+
     def ustvari_porocilo_pdf(self, izhod_pot):
         """Ustvari PDF poročilo z dodatnimi informacijami o deduplikaciji"""
         try: